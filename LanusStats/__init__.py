@@ -1,9 +1,46 @@
-from .fbref import Fbref
-from .threesixfivescores import ThreeSixFiveScores
-from .sofascore import SofaScore
-from .fotmob import FotMob
-from .datafactory import DataFactory
-from .transfermarkt import Transfermarkt
+import importlib
 from .functions import *
 from .exceptions import *
-from .visualizations import *
\ No newline at end of file
+from .leagues import get_registry, reload_registry
+
+# The scrapers and plots are imported the first time they are used, so `import LanusStats`
+# does not load matplotlib, selenium or the browsers, and does not start any thread.
+_LAZY_ATTRIBUTES = {
+    'Fbref': '.fbref',
+    'ThreeSixFiveScores': '.threesixfivescores',
+    'SofaScore': '.sofascore',
+    'FotMob': '.fotmob',
+    'DataFactory': '.datafactory',
+    'Transfermarkt': '.transfermarkt',
+    'ResponseCache': '.cache',
+    'OutputSink': '.output',
+    'Warehouse': '.warehouse',
+    'SeasonSync': '.sync',
+    'SyncManifest': '.sync',
+    'fotmob_match_momentum_plot': '.visualizations',
+    'fotmob_hexbin_shotmap': '.visualizations',
+    'threesixfivescores_match_shotmap': '.visualizations',
+    'transfermarkt_player_market_value': '.visualizations',
+    'sofascore_plot_match_events': '.visualizations',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif not name.startswith('_'):
+        try:
+            # Submodules, e.g. LanusStats.cache.DEFAULT_TTLS
+            value = importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
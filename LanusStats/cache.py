@@ -0,0 +1,466 @@
+import os
+import re
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+ONE_MINUTE = 60
+ONE_HOUR = 60 * ONE_MINUTE
+ONE_DAY = 24 * ONE_HOUR
+NEVER_EXPIRES = None
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'lanusstats', 'cache.sqlite')
+
+_MISSING = object()
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def normalize_url(url):
+    """Normalize a request URL so equivalent requests share the same cache key.
+
+    Lowercases scheme and host, drops the fragment and sorts the query parameters.
+
+    Args:
+        url (str): URL (or path) of the request.
+
+    Returns:
+        str: Normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+def _match_finished(data):
+    """True/False if a match payload says the match is over, None if it doesn't say."""
+    if isinstance(data, dict):
+        event = data.get('event')
+        general = data.get('general')
+        game = data.get('game')
+        if isinstance(event, dict) and isinstance(event.get('status'), dict):
+            return event['status'].get('type') == 'finished'
+        elif isinstance(general, dict) and 'finished' in general:
+            return bool(general.get('finished'))
+        elif isinstance(game, dict) and 'statusGroup' in game:
+            return game.get('statusGroup') == 4
+        elif isinstance(data.get('games'), list) and data['games']:
+            # Respuestas de 365Scores de varios partidos (game stats con games=...)
+            statuses = [game.get('statusGroup') for game in data['games'] if isinstance(game, dict)]
+            if statuses and None not in statuses:
+                return all(status == 4 for status in statuses)
+    return None
+
+
+def _match_status_ttl(data):
+    """TTL for match payloads that say if the match is over: finished matches never expire."""
+    finished = _match_finished(data)
+    if finished is None:
+        return ONE_DAY
+    return NEVER_EXPIRES if finished else ONE_MINUTE
+
+
+class FinishedMatchTTL:
+    """TTL rule for match resources whose payload doesn't say if the match is over (shotmap,
+    lineups, statistics, ...). They get finished_ttl once a payload of the match was cached
+    saying it is finished, and live_ttl otherwise, so a live match is never served stale for long.
+
+    The TTL is checked again when the value is read: a value stored with live_ttl that was
+    fetched at most live_ttl before the match was seen finished (for example the shotmap
+    requested together with the event) is kept as if it had finished_ttl.
+
+    Args:
+        finished_ttl (int, optional): TTL when the match is known to be over. Defaults to one day.
+        live_ttl (int, optional): TTL when the match may still be in play. Defaults to one minute.
+    """
+
+    def __init__(self, finished_ttl=ONE_DAY, live_ttl=ONE_MINUTE):
+        self.finished_ttl = finished_ttl
+        self.live_ttl = live_ttl
+
+
+# (regex over the normalized URL with the match id as group, source). A cached match
+# payload marks its match as finished for the FinishedMatchTTL rules of its resources.
+MATCH_KEYS = [
+    (re.compile(r'sofascore\.com/api/v1/event/(\d+)', re.IGNORECASE), 'sofascore'),
+    (re.compile(r'fotmob\.com/api/data/matchdetails\?(?:.*&)?matchid=(\d+)', re.IGNORECASE), 'fotmob'),
+    (re.compile(r'365scores\.com/web/game/\?(?:.*&)?gameid=(\d+)', re.IGNORECASE), '365scores'),
+    (re.compile(r'365scores\.com/web/game/stats/\?(?:.*&)?games=([\d,%C]+)', re.IGNORECASE), '365scores'),
+]
+
+
+def match_refs(key):
+    """'source:id' of the matches a normalized URL belongs to (several for batched requests)."""
+    for pattern, source in MATCH_KEYS:
+        found = pattern.search(key)
+        if found:
+            ids = found.group(1).upper().replace('%2C', ',').split(',')
+            return [f'{source}:{match_id}' for match_id in ids if match_id]
+    return []
+
+
+def json_cacheable(data):
+    """Default cacheable check of JSON APIs: error payloads are not stored."""
+    return isinstance(data, dict) and 'error' not in data
+
+
+# (regex over the normalized URL, ttl). ttl is seconds, NEVER_EXPIRES, a FinishedMatchTTL,
+# or a callable that receives the fetched value and returns one of those.
+DEFAULT_TTLS = [
+    (r'sofascore\.com/api/v1/event/\d+$', _match_status_ttl),
+    (r'fotmob\.com/api/data/matchdetails', _match_status_ttl),
+    (r'365scores\.com/web/game/\?', _match_status_ttl),
+    (r'sofascore\.com/api/v1/event/\d+/', FinishedMatchTTL()),
+    (r'365scores\.com/web/game/stats/', FinishedMatchTTL()),
+    (r'datafactory\.la/.*/events/\d+\.json', ONE_DAY),
+    (r'fbref\.com/\w+/matches/', ONE_DAY),
+    (r'transfermarkt\.', ONE_DAY),
+    (r'/statistics\?|/standings|/api/data/leagues\?|leagueseasondeepstats|/web/stats/|fbref\.com/\w+/comps/', ONE_HOUR),
+]
+
+
+class ResponseCache:
+    """In-memory LRU in front of an on-disk SQLite store, keyed by normalized request URL.
+
+    Usage:
+        cache = ResponseCache()
+        sofascore = SofaScore(cache=cache)
+        fotmob = FotMob(cache=cache)
+
+    Args:
+        path (str, optional): SQLite file used as on-disk store. None keeps the cache only
+            in memory. Defaults to ~/.cache/lanusstats/cache.sqlite.
+        ttls (list, optional): (regex, ttl) pairs checked in order against the normalized URL.
+            Defaults to DEFAULT_TTLS.
+        default_ttl (int, optional): TTL in seconds when no rule matches. Defaults to one hour.
+        max_memory_entries (int, optional): Entries kept in the in-memory LRU. Defaults to 256.
+        max_disk_bytes (int, optional): Size of the on-disk store before evicting the least
+            recently used entries. Defaults to 512 MB.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttls=None, default_ttl=ONE_HOUR,
+                 max_memory_entries=256, max_disk_bytes=512 * 1024 * 1024):
+        self.path = path
+        self.ttls = [(re.compile(pattern, re.IGNORECASE), ttl) for pattern, ttl in (ttls if ttls is not None else DEFAULT_TTLS)]
+        self.default_ttl = default_ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+        self._db = None
+        if path is not None:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, '
+                'accessed_at REAL NOT NULL, size INTEGER NOT NULL)'
+            )
+            self._db.commit()
+
+    def make_key(self, url, namespace=None):
+        key = normalize_url(url)
+        return f'{namespace}:{key}' if namespace else key
+
+    def ttl_for(self, key, value):
+        """Resolve the TTL of a value with the first rule whose regex matches the key."""
+        for pattern, ttl in self.ttls:
+            if pattern.search(key):
+                if isinstance(ttl, FinishedMatchTTL):
+                    return ttl.finished_ttl if self.is_finished(key) else ttl.live_ttl
+                return ttl(value) if callable(ttl) else ttl
+        return self.default_ttl
+
+    def is_finished(self, key):
+        """True if every match of a key was seen finished in a cached match payload."""
+        return self._finished_at(key) is not None
+
+    def _finished_at(self, key):
+        """When the last of the matches of a key was first seen finished, or None."""
+        refs = match_refs(key)
+        seen = [self.get(f'finished:{ref}') for ref in refs]
+        if not refs or None in seen:
+            return None
+        return max(seen)
+
+    def _renewed_expiry(self, key, expires_at):
+        """New expires_at of an expired FinishedMatchTTL value whose match turned out to be
+        finished when it was fetched, or _MISSING if it really expired."""
+        rule = next((ttl for pattern, ttl in self.ttls if pattern.search(key)), None)
+        if not isinstance(rule, FinishedMatchTTL) or rule.live_ttl is NEVER_EXPIRES:
+            return _MISSING
+        finished_at = self._finished_at(key)
+        if finished_at is None:
+            return _MISSING
+        fetched_at = expires_at - rule.live_ttl
+        # Values stored with finished_ttl end up far before finished_at and never match.
+        if not -rule.live_ttl <= finished_at - fetched_at <= rule.live_ttl:
+            return _MISSING
+        if rule.finished_ttl is NEVER_EXPIRES:
+            return None
+        renewed = fetched_at + rule.finished_ttl
+        return renewed if renewed > time.time() else _MISSING
+
+    def get(self, key, default=None):
+        """Return the cached value for a key, or default if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                blob, expires_at = entry
+                if expires_at is not None and expires_at <= now:
+                    expires_at = self._renewed_expiry(key, expires_at)
+                    if expires_at is not _MISSING:
+                        self._renew(key, blob, expires_at)
+                if expires_at is None or (expires_at is not _MISSING and expires_at > now):
+                    self._memory.move_to_end(key)
+                    return pickle.loads(blob)
+                self._memory.pop(key, None)
+
+            if self._db is None:
+                return default
+            row = self._db.execute('SELECT value, expires_at FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return default
+            blob, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                expires_at = self._renewed_expiry(key, expires_at)
+                if expires_at is _MISSING:
+                    self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                    self._db.commit()
+                    return default
+                self._renew(key, blob, expires_at)
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            self._db.commit()
+            self._remember(key, blob, expires_at)
+            return pickle.loads(blob)
+
+    def set(self, key, value, ttl=_MISSING):
+        """Store a value. Without an explicit ttl it is resolved with the TTL rules."""
+        if ttl is _MISSING:
+            ttl = self.ttl_for(key, value)
+        now = time.time()
+        expires_at = None if ttl is NEVER_EXPIRES else now + ttl
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, blob, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)',
+                    (key, blob, expires_at, now, len(blob)),
+                )
+                self._evict_disk()
+                self._db.commit()
+        if _match_finished(value):
+            for ref in match_refs(key):
+                if self.get(f'finished:{ref}') is None:
+                    self.set(f'finished:{ref}', now, NEVER_EXPIRES)
+
+    def get_or_fetch(self, url, fetch, namespace=None, ttl=_MISSING, cacheable=None):
+        """Return the cached value of a URL or call fetch() and cache its result.
+
+        Args:
+            url (str): URL of the request, used as key after normalization.
+            fetch (callable): Function without arguments that does the real request.
+            namespace (str, optional): Prefix to separate different values for the same URL.
+            ttl (int, optional): Explicit TTL in seconds (None never expires). Defaults to the TTL rules.
+            cacheable (callable, optional): Predicate over the fetched value; falsy results are not stored.
+
+        Returns:
+            Cached or freshly fetched value.
+        """
+        key = self.make_key(url, namespace)
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = fetch()
+        if cacheable is None or cacheable(value):
+            self.set(key, value, ttl)
+        return value
+
+    def delete(self, key):
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._db.commit()
+
+    def delete_prefix(self, prefix):
+        """Remove every entry whose key starts with prefix."""
+        with self._lock:
+            for key in [key for key in self._memory if key.startswith(prefix)]:
+                del self._memory[key]
+            if self._db is not None:
+                escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                self._db.execute("DELETE FROM responses WHERE key LIKE ? ESCAPE '\\'", (escaped + '%',))
+                self._db.commit()
+
+    def clear(self):
+        """Remove every entry, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM responses')
+                self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _renew(self, key, blob, expires_at):
+        self._remember(key, blob, expires_at)
+        if self._db is not None:
+            self._db.execute('UPDATE responses SET expires_at = ? WHERE key = ?', (expires_at, key))
+            self._db.commit()
+
+    def _remember(self, key, blob, expires_at):
+        self._memory[key] = (blob, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        self._db.execute('DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),))
+        rows = self._db.execute('SELECT key, size FROM responses ORDER BY accessed_at ASC').fetchall()
+        total = sum(size for _, size in rows)
+        for key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._memory.pop(key, None)
+            total -= size
+
+
+class CoalescingLRU:
+    """Bounded in-process LRU of parsed values where concurrent callers asking for the
+    same key while it is being fetched wait for that single fetch instead of repeating it.
+
+    Values are shared between callers, treat them as read-only.
+
+    Args:
+        maxsize (int, optional): Values kept before dropping the least recently used, None keeps
+            every value. Defaults to 32.
+        ttl (int, optional): Seconds a value is kept (NEVER_EXPIRES keeps it until it is dropped or
+            invalidated), or a callable that receives the value and returns one of those, like
+            the TTL rules of ResponseCache. Defaults to NEVER_EXPIRES.
+    """
+
+    def __init__(self, maxsize=32, ttl=NEVER_EXPIRES):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._values = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._fresh(key) or key in self._in_flight
+
+    def get(self, key, default=None):
+        """Return the value of key if it is stored and not expired, without fetching it."""
+        with self._lock:
+            if self._fresh(key):
+                return self._values[key][0]
+            return default
+
+    def put(self, key, value, ttl=_MISSING):
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def get_or_compute(self, key, compute, ttl=_MISSING, cacheable=None):
+        """Return the value of key, calling compute() only if nobody has it or is already fetching it.
+
+        Args:
+            key: Key of the value.
+            compute (callable): Function without arguments that returns the value.
+            ttl (int, optional): TTL of this value instead of the one of the LRU.
+            cacheable (callable, optional): Predicate over the value; falsy values are returned
+                (also to the callers waiting for them) but not stored.
+        """
+        with self._lock:
+            if self._fresh(key):
+                self._values.move_to_end(key)
+                return self._values[key][0]
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as error:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(error)
+            raise
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if cacheable is None or cacheable(value):
+                self._store(key, value, ttl)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key):
+        """Drop the value of key, so the next call fetches it again."""
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def _fresh(self, key):
+        entry = self._values.get(key)
+        if entry is None:
+            return False
+        if entry[1] is not None and entry[1] <= time.time():
+            del self._values[key]
+            return False
+        return True
+
+    def _store(self, key, value, ttl=_MISSING):
+        if ttl is _MISSING:
+            ttl = self.ttl
+        if callable(ttl):
+            ttl = ttl(value)
+        self._values[key] = (value, None if ttl is NEVER_EXPIRES else time.time() + ttl)
+        self._values.move_to_end(key)
+        while self.maxsize is not None and len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+
+def resolve_cache(cache):
+    """Turn the cache= option of the scraper classes into a ResponseCache (or None).
+
+    Args:
+        cache (None|bool|str|ResponseCache): None/False disables caching, True uses the
+            default on-disk cache (shared by every class), a string is the path of the SQLite file and a
+            ResponseCache instance is used as is (can be shared between classes).
+
+    Returns:
+        ResponseCache or None.
+    """
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        global _default_cache
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ResponseCache()
+        return _default_cache
+    if isinstance(cache, (str, os.PathLike)):
+        return ResponseCache(path=os.fspath(cache))
+    return cache
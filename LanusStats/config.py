@@ -1,7 +1,3 @@
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-import matplotlib as mpl
-
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3',
     'Accept-Language': 'en-US,en;q=0.5',
@@ -27,9 +23,6 @@ colors_bordo_to_white = [
 
 colors_bordo_to_white.reverse()
 
-granate_blanco_cmap = LinearSegmentedColormap.from_list('bordo_to_white', colors_bordo_to_white, N=50)
-mpl.colormaps.register(name='granate_blanco', cmap=granate_blanco_cmap)
-
 colors = [
     '#d0d6d4',
     '#c5d0cd',
@@ -49,5 +42,26 @@ colors = [
     '#327877',
     '#287271',
 ]
-soc_cm = LinearSegmentedColormap.from_list('colors', colors, N=50)
-mpl.colormaps.register(name='SOC', cmap=soc_cm)
\ No newline at end of file
+
+_colormaps = {}
+
+
+def _build_colormaps():
+    import matplotlib as mpl
+    from matplotlib.colors import LinearSegmentedColormap
+
+    _colormaps['granate_blanco_cmap'] = LinearSegmentedColormap.from_list('bordo_to_white', colors_bordo_to_white, N=50)
+    _colormaps['soc_cm'] = LinearSegmentedColormap.from_list('colors', colors, N=50)
+    for name, cmap in [('granate_blanco', _colormaps['granate_blanco_cmap']), ('SOC', _colormaps['soc_cm'])]:
+        if name not in mpl.colormaps:
+            mpl.colormaps.register(name=name, cmap=cmap)
+
+
+def __getattr__(name):
+    # The colormaps (registered in matplotlib as 'granate_blanco' and 'SOC') are built the
+    # first time they are used, so importing the scrapers does not load matplotlib.
+    if name in ('granate_blanco_cmap', 'soc_cm'):
+        if not _colormaps:
+            _build_colormaps()
+        return _colormaps[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,33 @@
 #With great help and a lot of the credit to https://github.com/valensantarone (Valko)
 
-import requests
+import itertools
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import pandas as pd
 import numpy as np
 from .config import headers
 from .functions import get_possible_leagues_for_page
+from .cache import resolve_cache
+from .output import resolve_sink
+from .session import make_session
 from .exceptions import InvalidStat, MatchDoesntHaveInfo
 
 class DataFactory:
+    """Events of the matches of DataFactory.
+
+    Args:
+        cache (None|bool|str|ResponseCache, optional): Cache of the match JSONs. Defaults to None.
+        timeout (float, optional): Seconds to wait for a response. Defaults to 30.
+        max_retries (int, optional): Retries, with exponential backoff, of a request after
+            connection errors, 429 or 5xx responses. Defaults to 3.
+        pool_size (int, optional): Connections kept open, the most threads that ingest_matches
+            uses. Defaults to 8.
+    """
     
-    def __init__(self):
+    def __init__(self, cache=None, timeout=30, max_retries=3, pool_size=8):
+        self.cache = resolve_cache(cache)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.session = make_session(headers, pool_size=pool_size, max_retries=max_retries)
         self.possible_incidences = ['goals', 'substitutions', 'clearances', 'cornerKicks', 'correctPasses', 'fouls', 'incorrectPasses', 'offsides', 'redCards', 'shots', 'status', 'stealings', 'yellowCards', 'throwIn', 'goalkick', 'nutmegs', 'sombreroFlick', 'penaltyShootout', 'var']
 
     def make_url(self, league, match_id):
@@ -20,14 +38,21 @@ class DataFactory:
 
     def make_request(self, league, match_id):
         path = self.make_url(league, match_id)
-        data = requests.get(path, headers=headers).json()
-        return data
+        if self.cache is not None:
+            return self.cache.get_or_fetch(path, lambda: self._download(path))
+        return self._download(path)
+
+    def _download(self, path):
+        response = self.session.get(path, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
     
     def get_incidence_df(self, data, incidence_type):
         if incidence_type not in self.possible_incidences:
             raise InvalidStat(incidence_type, incidence_type, self.possible_incidences)
         incidence = data['incidences'][incidence_type]
-        df = pd.DataFrame.from_dict(incidence, orient='index')
+        # Same frame as from_dict(orient='index'), built from the list of events at once
+        df = pd.DataFrame(list(incidence.values()), index=list(incidence.keys()) or None)
         return df
     
     def get_teams_ids(self, data):
@@ -41,29 +66,56 @@ class DataFactory:
         return home, away
     
     def parse_coordinates(self, df, league, match_id):
+        """Add x, y, endX and endY (0-100, second half flipped so both halves attack the same way)
+        from the coord column, reading the nested dicts in a single pass.
+        """
         try:
-            df['x'] = df['coord'].dropna().apply(lambda x: x['1']['x'])
+            coordinates = self._coordinates_array(df['coord'].tolist())
         except KeyError:
             path = self.make_url(league, match_id)
             raise MatchDoesntHaveInfo(path)
-        df['y'] = df['coord'].dropna().apply(lambda x: x['1']['y'])
-        df['endX'] = df['coord'].dropna().apply(lambda x: x['2']['x'])
-        df['endY'] = df['coord'].dropna().apply(lambda x: x['2']['y'])
-
-        df['x'] = (df['x'] + 1) * 50
-        df['y'] = (df['y'] + 1) * 50
-        df['endX'] = (df['endX'] + 1) * 50
-        df['endY'] = (df['endY'] + 1) * 50
+        coordinates = (coordinates + 1) * 50
 
-        df.loc[df['t'].apply(lambda x: x['half']) == 2, ['x', 'y', 'endX', 'endY']] = 100 - df.loc[df['t'].apply(lambda x: x['half']) == 2, ['x', 'y', 'endX', 'endY']]
+        halves, _, _ = self._time_arrays(df['t'].tolist())
+        second_half = halves == 2
+        coordinates[second_half] = 100 - coordinates[second_half]
+        coordinates[:, [1, 3]] = 100 - coordinates[:, [1, 3]]
 
-        df['y'] = 100 - df['y']
-        df['endY'] = 100 - df['endY']
+        df['x'] = coordinates[:, 0]
+        df['y'] = coordinates[:, 1]
+        df['endX'] = coordinates[:, 2]
+        df['endY'] = coordinates[:, 3]
 
         df.drop('coord', axis=1, inplace=True)
 
         return df
-    
+
+    def _coordinates_array(self, coords):
+        """Array (rows, 4) with start x, start y, end x and end y of each coord dict (NaN if missing)."""
+        nan = float('nan')
+        no_end = {'x': nan, 'y': nan}
+        rows = [
+            (coord['1']['x'], coord['1']['y'], (coord.get('2') or no_end)['x'], (coord.get('2') or no_end)['y'])
+            if isinstance(coord, dict) else (nan, nan, nan, nan)
+            for coord in coords
+        ]
+        return np.array(rows, dtype=float).reshape(len(rows), 4)
+
+    def _time_arrays(self, times):
+        """Arrays with the half, minute and second of each t dict."""
+        nan = float('nan')
+        rows = [
+            (time_data.get('half', nan), time_data.get('m', nan), time_data.get('s', nan))
+            if isinstance(time_data, dict) else (nan, nan, nan)
+            for time_data in times
+        ]
+        values = np.array(rows, dtype=float).reshape(len(rows), 3)
+        return values[:, 0], values[:, 1], values[:, 2]
+
+    def _whole_numbers(self, values):
+        # Integers when nothing is missing, like the values of the JSON
+        return values.astype(np.int64) if not np.isnan(values).any() else values
+
     def get_minute(self, row):
             if row['t']['half'] == 1:
                 return row['t']['m']
@@ -74,8 +126,10 @@ class DataFactory:
         return row['t']['s']
     
     def parse_minutes(self, df):
-        df['minute'] = df.apply(self.get_minute, axis=1)
-        df['seconds'] = df.apply(self.get_seconds, axis=1)
+        halves, minutes, seconds = self._time_arrays(df['t'].tolist())
+        # Only the minutes of the first and second half, as get_minute
+        df['minute'] = self._whole_numbers(np.where(np.isin(halves, [1, 2]), minutes, np.nan))
+        df['seconds'] = self._whole_numbers(seconds)
         df.drop('t', axis=1, inplace=True)
         return df
 
@@ -91,6 +145,13 @@ class DataFactory:
         plyrId = int(plyrId)
         return data['players'][f'{plyrId}']['name']['last']
     
+    def get_player_names(self, data):
+        """Dict player id -> last name of every player of the match."""
+        return {
+            int(player_id): (player.get('name') or {}).get('last')
+            for player_id, player in data['players'].items()
+        }
+
     def add_home_away_columns(self, data, df):
         home, away = self.get_teams_name(data)
         home_id, away_id = self.get_teams_ids(data)
@@ -98,6 +159,20 @@ class DataFactory:
         df['home/away'] = np.where(df.team == home_id, 'home', 'away')
         return df
     
+    def _normalize_events(self, df, data, league, match_id, names=None):
+        """Coordinates, minutes, player names (if names is given) and home/away of an incidence frame."""
+        if 'coord' in df.columns:
+            df = self.parse_coordinates(df, league, match_id)
+        if 't' in df.columns:
+            df = self.parse_minutes(df)
+        if names is not None:
+            for id_column, name_column in [('recvId', 'recvName'), ('plyrId', 'plyrName')]:
+                if id_column in df.columns:
+                    df[name_column] = df[id_column].map(names)
+        if 'team' in df.columns:
+            df = self.add_home_away_columns(data, df)
+        return df
+
     def get_match_passes(self, league, match_id, all_passes=False):
         data = self.make_request(league, match_id)
         df = self.get_incidence_df(data, 'correctPasses')
@@ -105,28 +180,129 @@ class DataFactory:
             df_incorrect = self.get_incidence_df(data, 'incorrectPasses')
             df = pd.concat([df, df_incorrect])
 
-        df = self.parse_coordinates(df, league, match_id)
-
-        df = self.parse_minutes(df)
-
-        df['recvName'] = df['recvId'].apply(lambda x: self.get_recv_name(x, data))
-        df['plyrName'] = df['plyrId'].apply(lambda x: self.get_plyr_name(x, data))
-
-        df = self.add_home_away_columns(data, df)
-
-        return df
+        return self._normalize_events(df, data, league, match_id, self.get_player_names(data))
     
     def get_incidence(self, league, match_id, incidence_type):
         print("Possible values for incidence_type param: ", self.possible_incidences)
 
         data = self.make_request(league, match_id)
         df = self.get_incidence_df(data, incidence_type)
-        
-        if 'coord' in df.columns:
-            df = self.parse_coordinates(df, league, match_id)
 
-        df = self.parse_minutes(df)
+        return self._normalize_events(df, data, league, match_id)
 
-        df = self.add_home_away_columns(data, df)
+    def get_match_events(self, league, match_id, incidence_types='all', as_dict=False):
+        """Get every incidence of a match (goals, shots, fouls, passes, cards, ...) with a single download.
 
-        return df
+        The coordinates, minutes, player names and home/away columns are the same as
+        in get_match_passes and get_incidence.
+
+        Args:
+            league (str): Possible leagues in get_available_leagues("DataFactory")
+            match_id (int): Id of the match in DataFactory
+            incidence_types (str|list, optional): 'all' or values of possible_incidences. Defaults to 'all'.
+            as_dict (bool, optional): Return a dict incidence type -> DataFrame instead of one
+                long DataFrame. Defaults to False.
+
+        Raises:
+            InvalidStat: If an incidence type is not inside possible_incidences.
+
+        Returns:
+            DataFrame: One row per event, ordered by minute (the events without minute go last, in
+                the order of the feed), with incidence_type and incidence_id columns. The columns
+                that a type does not have are empty.
+        """
+        if incidence_types == 'all':
+            incidence_types = self.possible_incidences
+        elif isinstance(incidence_types, str):
+            incidence_types = [incidence_types]
+        for incidence_type in incidence_types:
+            if incidence_type not in self.possible_incidences:
+                raise InvalidStat('incidence_types', incidence_type, self.possible_incidences)
+
+        data = self.make_request(league, match_id)
+        names = self.get_player_names(data)
+        frames = {}
+        for incidence_type in incidence_types:
+            if not data['incidences'].get(incidence_type):
+                frames[incidence_type] = pd.DataFrame()
+                continue
+            df = self.get_incidence_df(data, incidence_type)
+            frames[incidence_type] = self._normalize_events(df, data, league, match_id, names)
+        if as_dict:
+            return frames
+
+        events = [
+            df.rename_axis('incidence_id').reset_index().assign(incidence_type=incidence_type)
+            for incidence_type, df in frames.items() if not df.empty
+        ]
+        if not events:
+            return pd.DataFrame(columns=['incidence_type', 'incidence_id'])
+        events = pd.concat(events, ignore_index=True)
+        events = events[['incidence_type'] + [column for column in events.columns if column != 'incidence_type']]
+        order = [column for column in ['minute', 'seconds'] if column in events.columns]
+        if order:
+            events = events.sort_values(order, kind='stable', na_position='last', ignore_index=True)
+        return events
+
+    def ingest_matches(self, league, match_ids, sink, incidence_types='all', season=None, workers=None):
+        """Download the events of many matches and write each match to sink as soon as it is
+        parsed, so a whole season is never held in memory.
+
+        The matches are downloaded by up to workers threads sharing the keep-alive session,
+        with the retries and backoff of the session.
+
+        Usage:
+            datafactory = DataFactory(pool_size=8)
+            report = datafactory.ingest_matches('Liga Profesional', range(10000, 10500), OutputSink('datos'))
+
+        Args:
+            league (str): Possible leagues in get_available_leagues("DataFactory")
+            match_ids (list|range): Ids of the matches in DataFactory.
+            sink (str|OutputSink|Warehouse|callable): Where the events of each match (as
+                get_match_events returns them) go. A folder or OutputSink writes one file per match
+                of the table 'events', a Warehouse upserts them in datafactory_incidences and a
+                callable is called as sink(match_id, events).
+            incidence_types (str|list, optional): As in get_match_events. Defaults to 'all'.
+            season (str, optional): Season written in the OutputSink partition. Defaults to None.
+            workers (int, optional): Matches downloaded at the same time. Defaults to pool_size.
+
+        Returns:
+            DataFrame: One row per match with match_id, status ('ok', 'empty', 'no_info' or
+                'error'), events (rows written) and error.
+        """
+        write = self._events_writer(sink, league, season)
+        workers = workers or self.pool_size
+        match_ids = iter(match_ids)
+        report = []
+
+        def ingest(match_id):
+            try:
+                events = self.get_match_events(league, match_id, incidence_types)
+            except MatchDoesntHaveInfo:
+                return {'match_id': match_id, 'status': 'no_info', 'events': 0, 'error': None}
+            except Exception as error:
+                return {'match_id': match_id, 'status': 'error', 'events': 0, 'error': repr(error)}
+            if events.empty:
+                return {'match_id': match_id, 'status': 'empty', 'events': 0, 'error': None}
+            write(match_id, events)
+            return {'match_id': match_id, 'status': 'ok', 'events': len(events), 'error': None}
+
+        # Only a few matches in flight at a time, each one is written and dropped when it finishes
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(ingest, match_id) for match_id in itertools.islice(match_ids, workers * 2)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.append(future.result())
+                pending |= {executor.submit(ingest, match_id) for match_id in itertools.islice(match_ids, len(done))}
+        return pd.DataFrame(report, columns=['match_id', 'status', 'events', 'error'])
+
+    def _events_writer(self, sink, league, season):
+        if callable(sink):
+            return sink
+        if hasattr(sink, 'store_datafactory_events'):
+            return lambda match_id, events: sink.store_datafactory_events(events, league, match_id)
+        output = resolve_sink(sink)
+        if output is None:
+            raise ValueError('ingest_matches needs a sink to write the events')
+        return lambda match_id, events: output.write(events, 'events', 'DataFactory', league, season, part=match_id)
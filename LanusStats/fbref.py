@@ -1,29 +1,176 @@
 import warnings
 warnings.filterwarnings("ignore")
-from bs4 import BeautifulSoup, Comment
 import pandas as pd
 from datetime import datetime
-import time
 import numpy as np
 import asyncio
 import json
 import atexit
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+import sys
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pydoll.browser import Chrome
+from pydoll.exceptions import BrowserException, ConnectionException
 from .functions import get_possible_leagues_for_page, possible_stats_exception
+from .cache import resolve_cache
+from .output import resolve_sink
+from .throttle import PolitenessScheduler
+from .parsers import get_parser
 from .exceptions import PlayerDoesntHaveInfo, MatchDoesntHaveInfo
 
-if '_HTML_FETCH_EXECUTOR' not in globals():
-    _HTML_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2)
-    atexit.register(_HTML_FETCH_EXECUTOR.shutdown, wait=False)
-
 _PAGE_READY_TIMEOUT = 12
 _PAGE_READY_POLL_INTERVAL = 0.4
+_PAGE_LOAD_TIMEOUT = 60
+_MAX_RETRIES = 3
+# Errors that mean the browser itself crashed or is unreachable, so it has to be restarted.
+# Anything else (a page that timed out, a script that failed) is retried on a fresh tab.
+_BROWSER_ERRORS = (BrowserException, ConnectionException, OSError)
+
+# Columns of the stats tables that are not numbers. Age is '24-123' (years-days) in the
+# player tables. Every other column is converted to Int64 or float64.
+_PLAYER_TEXT_COLUMNS = {'Player', 'Nation', 'Pos', 'Squad', 'Comp', 'Age'}
+_TEAM_TEXT_COLUMNS = {'Squad', 'Comp'}
+_CATEGORY_COLUMNS = {'Nation', 'Pos', 'Squad', 'Comp'}
+_DOUBLE_ENCODING_MARKERS = 'Ã|Â|¢|â'
+# Pages served instead of the real one when FBref blocks or rate limits the browser
+_BLOCKED_PAGE_MARKERS = ('<title>Just a moment...</title>', 'Rate Limited Request')
+
+
+def _cacheable_html(html):
+    """Only real FBref pages are cached, not empty, challenge or rate limit pages."""
+    return isinstance(html, str) and bool(html.strip()) and not any(marker in html for marker in _BLOCKED_PAGE_MARKERS)
+
+
+def _close_at_exit(fbref_ref):
+    fbref = fbref_ref()
+    if fbref is not None:
+        fbref.close()
+
+
+class _TableIndex:
+    """Every <table> of an FBref page, live or commented out, found in a single pass.
+
+    FBref ships most of its tables inside HTML comments and un-comments them with JS.
+    Each comment that contains a table is parsed once, and every lookup for the page
+    is served from this index.
+    """
+
+    def __init__(self, document, parser):
+        self.live = parser.tables(document)
+        # (comment text, tables in it), in page order
+        self.commented = []
+        for comment in parser.comments(document):
+            if '<table' not in comment:
+                continue
+            tables = parser.tables(parser.parse(comment))
+            if tables:
+                self.commented.append((comment, tables))
+
+        # Live tables win over commented ones, and earlier ones over later ones
+        self.by_id = {}
+        for table in self.live + [table for _, tables in self.commented for table in tables]:
+            table_id = table.get('id')
+            if table_id and table_id not in self.by_id:
+                self.by_id[table_id] = table
+
+    def default_tables(self):
+        """The live tables, or the ones in the first comment that has any."""
+        if self.live:
+            return self.live
+        return self.commented[0][1] if self.commented else []
+
+    def container_table(self):
+        """First table of the last commented-out table_container, where the player stats are."""
+        tables = None
+        for comment, comment_tables in self.commented:
+            if 'class="table_container"' in comment:
+                tables = comment_tables
+        if tables is None:
+            tables = self.default_tables()
+        return tables[0] if tables else None
+
+
+def _parse_stats_page(parser, method_name, html, *args):
+    """Worker-process entry point: parse a stats page with a throwaway Fbref (it never opens a browser)."""
+    return getattr(Fbref(parser=parser), method_name)(html, *args)
+
+
+class FbrefPage:
+    """A Fbref page downloaded and parsed once, with every table kept in memory.
+
+    The checks (match_info_exception, player_info_exception) and the table accessors
+    read the same tables, so a page costs a single request. Get one with
+    Fbref.page(path).
+
+    Usage:
+        page = fbref.page(match_url)
+        shots = page.get_match_shots()
+        local_df, visit_df = page.get_general_match_team_stats()
+    """
+
+    def __init__(self, fbref, path):
+        self.path = path
+        self.tables = fbref.get_all_dfs(path)
+
+    def match_info_exception(self):
+        if len(self.tables) <= 17:
+            raise MatchDoesntHaveInfo(self.path)
+
+    def player_info_exception(self):
+        first_df = self.tables[0]
+        if first_df.columns[0] not in ['Statistic', 'Estadísticas'] and first_df.columns.dtype != 'O':
+            raise PlayerDoesntHaveInfo(self.path)
+
+    def get_player_percentiles(self):
+        self.player_info_exception()
+        return self.tables[0].copy()
+
+    def get_player_similarities(self):
+        self.player_info_exception()
+        return self.tables[1].copy()
+
+    def get_match_shots(self):
+        self.match_info_exception()
+        data = self.tables[17].copy()
+        data.columns = data.columns.droplevel(0)
+        return data
+
+    def get_general_match_team_stats(self):
+        self.match_info_exception()
+        return self.tables[3].copy(), self.tables[10].copy()
+
+    def get_tournament_table(self):
+        return self.tables[0].copy()
+
 
 class Fbref:
 
     ##############################################
-    def __init__(self):
+    def __init__(self, cache=None, request_delay=3, max_tabs=3, parser='bs4'):
+        if max_tabs < 1:
+            raise ValueError('max_tabs must be at least 1')
+        self.cache = resolve_cache(cache)
+        # 'bs4' (BeautifulSoup) or 'lxml', which is several times faster on the big stats tables
+        self.parser = get_parser(parser)
+        # The browser is started on the first request and reused by every page after
+        # that. It lives on a dedicated background event loop (like FotMob) so requests
+        # work the same from scripts, async code and Jupyter notebooks.
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+        self._browser = None
+        self._browser_lock = None
+        self._generation = 0
+        # Up to max_tabs pages load at once; the scheduler keeps request_delay seconds
+        # between the start of consecutive requests to fbref.com.
+        self.max_tabs = max_tabs
+        self.scheduler = PolitenessScheduler(request_delay)
+        self._idle_tabs = []
+        self._tab_slots = None
         self.possible_stats = [
             'stats',
             'keepers',
@@ -40,20 +187,25 @@ class Fbref:
 
     ##############################################
         
+    def page(self, path):
+        """Get a FbrefPage: the page is downloaded once and its checks and tables
+        (get_match_shots, get_general_match_team_stats, ...) are served from memory.
+
+        Args:
+            path (str): URL of a Fbref page (match, player or league).
+
+        Returns:
+            FbrefPage: Object with the tables of that page.
+        """
+        return FbrefPage(self, path)
+
     def match_info_exception(self, path):
-        data = self.get_all_dfs(path)
-        try:
-            data[17]
-        except IndexError:
-            raise MatchDoesntHaveInfo(path)
+        self.page(path).match_info_exception()
     
     def player_info_exception(self, path):
-        data = self.get_all_dfs(path)
-        first_df = data[0]
-        if first_df.columns[0] not in ['Statistic', 'Estadísticas'] and first_df.columns.dtype != 'O':
-            raise PlayerDoesntHaveInfo('path')
+        self.page(path).player_info_exception()
     
-    def get_teams_season_stats(self, stat, league, season=None, save_csv=False, stats_vs=False, change_columns_names=False, add_page_name=False):
+    def get_teams_season_stats(self, stat, league, season=None, save_csv=False, stats_vs=False, change_columns_names=False, add_page_name=False, sink=None):
         """Gets you a table of the stats for the teams in a certain league.
 
         Args:
@@ -64,6 +216,8 @@ class Fbref:
             stats_vs (bool, optional): If true it gives you the VS stats of that table. Defaults to False.
             change_columns_names (bool, optional): If you would like to change the columns names. Defaults to False.
             add_page_name (bool, optional): It add the stat name to the columns. Defaults to False.
+            sink (str|OutputSink, optional): Also write the table with an OutputSink (a folder
+                means Parquet files in that folder). Defaults to None.
 
         Returns:
             data: DataFrame with the data of the stats of the teams.
@@ -72,7 +226,19 @@ class Fbref:
         print("Starting to scrape teams data from Fbref...")
         possible_stats_exception(self.possible_stats, stat)
         leagues = get_possible_leagues_for_page(league, season, 'Fbref')
-        
+        path = self._teams_stats_path(stat, league, season, leagues)
+        html_content = self.fbref_request(path)
+        df = self._teams_stats_from_html(html_content, stat, stats_vs, change_columns_names, add_page_name)
+
+        if save_csv and not df.empty:
+            today = datetime.now().strftime('%Y-%m-%d')
+            df.to_csv(f'{league} - {stat} - {today}.csv', index=False)
+        sink = resolve_sink(sink)
+        if sink is not None and not df.empty:
+            sink.write(df, f'team_{"vs_" if stats_vs else ""}{stat}', 'Fbref', league, season)
+        return df
+
+    def _teams_stats_path(self, stat, league, season, leagues):
         if league == 'Big 5 European Leagues' and season is None:
             path = f'https://fbref.com/en/comps/{leagues[league]["id"]}/{stat}/squads/{leagues[league]["slug"]}-Stats'
         elif league == 'Big 5 European Leagues' and season is not None:
@@ -81,11 +247,10 @@ class Fbref:
             path = f'https://fbref.com/en/comps/{leagues[league]["id"]}/{season}/{stat}/{season}/{leagues[league]["slug"]}-Stats'
         else:
             path = f'https://fbref.com/en/comps/{leagues[league]["id"]}/{stat}/{leagues[league]["slug"]}-Stats'
-        
-        time.sleep(2)
-        
-        html_content = self.fbref_request(path)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        return path
+
+    def _teams_stats_from_html(self, html_content, stat, stats_vs=False, change_columns_names=False, add_page_name=False):
+        table_index = _TableIndex(self.parser.parse(html_content), self.parser)
 
         df = pd.DataFrame()
         normalized_stat = stat.rstrip('s') or stat
@@ -96,15 +261,15 @@ class Fbref:
         ]
 
         for table_id in preferred_ids:
-            df = self._build_dataframe_from_soup(soup, table_id=table_id)
+            df = self._build_dataframe_from_index(table_index, table_id=table_id)
             if not df.empty:
                 break
         if df.empty:
-            df = self._build_dataframe_from_soup(soup)
+            df = self._build_dataframe_from_index(table_index)
         if df.empty:
             return df
 
-        df = df.map(self._fix_encoding)
+        df = self._convert_dtypes(df, _TEAM_TEXT_COLUMNS)
 
         if change_columns_names:
             df.columns = [
@@ -115,10 +280,6 @@ class Fbref:
 
         if add_page_name:
             df.columns = [f'{stat}_' + col if col else col for col in df.columns]
-
-        if save_csv:
-            today = datetime.now().strftime('%Y-%m-%d')
-            df.to_csv(f'{league} - {stat} - {today}.csv', index=False)
         return df
 
     def get_vs_and_teams_season_stats(self, stat, league, season=None, save_excel=False, change_columns_names=False, add_page_name=False):
@@ -153,18 +314,50 @@ class Fbref:
     
         return df_total
         
-    def get_all_teams_season_stats(self, league, season, save_csv=False, stats_vs=False, change_columns_names=False, add_page_name=False):
-        
+    def get_all_teams_season_stats(self, league, season, save_csv=False, stats_vs=False, change_columns_names=False, add_page_name=False, parse_workers=None, sink=None):
+        """Gets every stat table of the teams in a league, joined in one DataFrame (one row per team).
+
+        The pages are loaded at the same time in up to max_tabs browser tabs and parsed in
+        parallel worker processes.
+
+        Args:
+            league (str): Possible leagues in get_available_leagues("Fbref")
+            season (str, optional): String showing the season for the data to be extracted.
+            save_csv (bool, optional): If true, it saves the table as a csv. Defaults to False.
+            stats_vs (bool, optional): If true it gives you the VS stats of the tables. Defaults to False.
+            change_columns_names (bool, optional): If you would like to change the columns names. Defaults to False.
+            add_page_name (bool, optional): It add the stat name to the columns. Defaults to False.
+            parse_workers (int, optional): Worker processes used to parse the pages. 0 parses them
+                in this process. Defaults to None (with the bs4 parser one per stat, up to the number
+                of CPUs; with lxml in this process).
+            sink (str|OutputSink, optional): Also write the table with an OutputSink (a folder
+                means Parquet files in that folder). Defaults to None.
+
+        Returns:
+            data: DataFrame with all the stats of the teams.
+        """
+        print("Starting to scrape teams data from Fbref...")
         today = datetime.now().strftime('%Y-%m-%d')
-        data = pd.DataFrame()
+        leagues = get_possible_leagues_for_page(league, season, 'Fbref')
+        paths = []
         for stat in self.possible_stats:
-            placeholder = self.get_teams_season_stats(f'{stat}',league, season, False, stats_vs, change_columns_names, add_page_name)
-            data = pd.concat([data, placeholder], axis=1)
+            paths.append(self._teams_stats_path(stat, league, season, leagues))
+        pages = self.fbref_request_many(paths)
+        frames = self._parse_stats_pages(
+            '_teams_stats_from_html',
+            [(html, stat, stats_vs, change_columns_names, add_page_name) for html, stat in zip(pages, self.possible_stats)],
+            parse_workers,
+        )
+        frames = [frame for frame in frames if not frame.empty]
+        data = self._join_stat_frames(frames, [[frame.iloc[:, 0]] for frame in frames])
         
         if save_csv and stats_vs:
             data.to_csv(f'{league} - {stat} - team vs stats - {today}.csv')
         elif save_csv: 
             data.to_csv(f'{league} - {stat} - team stats - {today}.csv')
+        sink = resolve_sink(sink)
+        if sink is not None:
+            sink.write(data, 'team_vs_stats' if stats_vs else 'team_stats', 'Fbref', league, season)
 
         return data
 
@@ -177,87 +370,26 @@ class Fbref:
         cols = [ele.text.strip() for ele in cols]
         return cols
 
-    def _parse_team_row(self, row):
-        """Return a row as [Squad, ...stats...] including squad name from the header."""
-        th = row.find('th', attrs={'data-stat': 'squad'}) or row.find('th', scope='row')
-        if th:
-            squad = th.get_text(strip=True)
-        else:
-            header = row.find('th')
-            squad = header.get_text(strip=True) if header else ''
-
-        cols = [ele.get_text(strip=True) for ele in row.find_all('td')]
-        parsed = [squad] + cols
-        return parsed if any(parsed) else None
-
-    def _collect_headings(self, table):
-        """Collect column headings from <thead>, skipping helper headers."""
-        source = table.find('thead') or table
-        headings = []
-        for th in source.find_all('th'):
-            if 'over_header' in th.get('class', []):
-                continue
-            scope = th.get('scope')
-            if scope and scope not in {'col', 'colgroup'}:
-                continue
-            text = th.get_text(strip=True)
-            if text:
-                headings.append(text)
-        if headings and (headings[0] == '' or headings[0].isdigit()):
-            headings = headings[1:]
-        return headings
-
-    def _extract_tables(self, soup):
-        """Return the soup/tables tuple, falling back to HTML comments if needed."""
-        direct_tables = soup.find_all('table')
-        if direct_tables:
-            return soup, direct_tables
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-            extracted = BeautifulSoup(comment, 'html.parser')
-            comment_tables = extracted.find_all('table')
-            if comment_tables:
-                return extracted, comment_tables
-        return soup, []
-
-    def _build_dataframe_from_soup(self, soup, table_id=None):
-        """Build a DataFrame from a soup, optionally targeting a specific table id."""
-        target_table = None
-        working_soup, tables = self._extract_tables(soup)
-
-        if table_id:
-            target_table = working_soup.find('table', id=table_id)
-            if not target_table:
-                for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-                    extracted = BeautifulSoup(comment, 'html.parser')
-                    target_table = extracted.find('table', id=table_id)
-                    if target_table:
-                        working_soup = extracted
-                        break
-            if target_table:
-                tables = [target_table]
-
-        if not tables:
-            working_soup, tables = self._extract_tables(working_soup)
-        if not tables:
-            return pd.DataFrame()
-
-        if not target_table:
+    def _build_dataframe_from_index(self, table_index, table_id=None):
+        """Build a DataFrame from a page's _TableIndex, optionally targeting a specific table id."""
+        target_table = table_index.by_id.get(table_id) if table_id else None
+        if target_table is None:
+            tables = table_index.default_tables()
+            if not tables:
+                return pd.DataFrame()
             target_table = next(
                 (
                     table
                     for table in tables
-                    if all(keyword in table.get_text() for keyword in ("Playing Time", "Performance", "Penalty Kicks"))
+                    if all(keyword in self.parser.text(table) for keyword in ("Playing Time", "Performance", "Penalty Kicks"))
                 ),
                 tables[0],
             )
 
-        headings = self._collect_headings(target_table)
-        body = target_table.find('tbody') or target_table
-        rows = []
-        for row in body.find_all('tr'):
-            parsed = self._parse_team_row(row)
-            if parsed:
-                rows.append(parsed)
+        headings = self.parser.headings(target_table)
+        if headings and headings[0].isdigit():
+            headings = headings[1:]
+        rows = self.parser.rows(target_table, row_header=True, strip_pieces=True)
 
         if not headings or not rows:
             return pd.DataFrame()
@@ -270,6 +402,51 @@ class Fbref:
         df = pd.DataFrame(aligned_rows, columns=headings[:max_cols])
         return df.replace('', pd.NA).dropna(how='all').reset_index(drop=True)
 
+    def _convert_dtypes(self, df, text_columns):
+        """Give a stats table real dtypes: numeric columns become Int64/float64, Squad/Nation/Pos/Comp
+        categorical and text columns get their encoding fixed.
+
+        Columns are handled by position because some tables repeat names (e.g. Gls in
+        Performance and in Per 90 Minutes). A column that is not entirely numeric is left as text.
+        """
+        columns = []
+        for position, name in enumerate(df.columns):
+            column = df.iloc[:, position]
+            if name not in text_columns:
+                numeric = self._to_numeric(column)
+                if numeric is not None:
+                    columns.append(numeric)
+                    continue
+            # Empty text cells were filled with 0 like the numeric ones, they are missing values
+            column = self._fix_encoding_column(column.replace(0, pd.NA))
+            if name in _CATEGORY_COLUMNS:
+                column = column.astype('category')
+            columns.append(column)
+        typed = pd.concat(columns, axis=1, ignore_index=True)
+        typed.columns = df.columns
+        return typed
+
+    def _to_numeric(self, column):
+        """Numeric version of a column of FBref cells ('1,234', '12.5', 0), None if some cell is not a number."""
+        text = column.astype('string').str.strip().str.replace(',', '', regex=False)
+        numeric = pd.to_numeric(text, errors='coerce')
+        if (numeric.isna() & text.notna() & (text != '')).any():
+            return None
+        if text.str.contains('.', regex=False).any():
+            return numeric.astype('float64')
+        return numeric.astype('Int64')
+
+    def _fix_encoding_column(self, column):
+        """Vectorized _fix_encoding: only the cells with double-encoding markers are repaired."""
+        if not (column.dtype == object or pd.api.types.is_string_dtype(column)):
+            return column
+        suspicious = column.astype('string').str.contains(_DOUBLE_ENCODING_MARKERS, regex=True).fillna(False).astype(bool)
+        if not suspicious.any():
+            return column
+        column = column.copy()
+        column[suspicious] = column[suspicious].map(self._fix_encoding)
+        return column
+
     def _fix_encoding(self, value):
         """Best-effort fix for strings that arrived double-encoded (Ã, â, etc.)."""
         if isinstance(value, str) and any(marker in value for marker in ("Ã", "Â", "¢", "â")):
@@ -289,66 +466,216 @@ class Fbref:
         Returns:
             str: HTML completo de la página.
         """
-        if url.startswith('/'):
-            full_url = f'https://fbref.com{url}'
-        else:
-            full_url = url
-
-        async def _wait_for_page(tab, timeout=_PAGE_READY_TIMEOUT):
-            loop = asyncio.get_running_loop()
-            deadline = loop.time() + timeout
-            while True:
-                ready_state = await tab.execute_script("return document.readyState")
-                if ready_state == "complete":
-                    body_length = await tab.execute_script(
-                        "return document.body ? document.body.innerHTML.length : 0;"
-                    )
-                    if isinstance(body_length, (int, float)) and body_length > 0:
-                        break
-                if loop.time() >= deadline:
-                    break
-                await asyncio.sleep(_PAGE_READY_POLL_INTERVAL)
-        
-        async def _get_html():
-            async with Chrome() as browser:
-                tab = await browser.start()
-                await tab.go_to(full_url)
+        full_url = self._full_url(url)
+        if self.cache is not None:
+            return self.cache.get_or_fetch(full_url, lambda: self._fetch_html(full_url), cacheable=_cacheable_html)
+        return self._fetch_html(full_url)
 
-                await _wait_for_page(tab)
+    def fbref_request_many(self, urls):
+        """Obtiene el HTML de varias páginas de FBref a la vez, en hasta max_tabs pestañas del mismo browser.
 
-                result = await tab.execute_script(
-                    "return document.documentElement.outerHTML;"
-                )
+        Args:
+            urls (list): URLs completas o paths relativos de páginas de FBref.
 
-                if isinstance(result, dict):
-                    value = (
-                        result.get("result", {})
-                            .get("result", {})
-                            .get("value")
+        Returns:
+            list: HTML de cada página, en el mismo orden que urls.
+        """
+        full_urls = [self._full_url(url) for url in urls]
+        pages = {}
+        missing = []
+        for full_url in dict.fromkeys(full_urls):
+            html = self.cache.get(self.cache.make_key(full_url)) if self.cache is not None else None
+            if html is not None:
+                pages[full_url] = html
+            else:
+                missing.append(full_url)
+
+        if missing:
+            future = asyncio.run_coroutine_threadsafe(self._get_many_html(missing), self._ensure_loop())
+            for full_url, html in zip(missing, future.result()):
+                pages[full_url] = html
+                if self.cache is not None and _cacheable_html(html):
+                    self.cache.set(self.cache.make_key(full_url), html)
+        return [pages[full_url] for full_url in full_urls]
+
+    def _full_url(self, url):
+        if url.startswith('/'):
+            return f'https://fbref.com{url}'
+        return url
+
+    def _fetch_html(self, full_url):
+        """Load full_url in a browser tab and return its HTML."""
+        future = asyncio.run_coroutine_threadsafe(self._get_html(full_url), self._ensure_loop())
+        return future.result()
+
+    async def _get_many_html(self, full_urls):
+        return await asyncio.gather(*(self._get_html(full_url) for full_url in full_urls))
+
+    def _ensure_loop(self):
+        """Start the background event loop that owns the browser, if it is not running yet."""
+        with self._loop_lock:
+            if self._loop is None:
+                # nodriver/pydoll launch Chrome as a subprocess, which needs ProactorEventLoop on Windows.
+                if sys.platform == 'win32':
+                    self._loop = asyncio.ProactorEventLoop()
+                else:
+                    self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    daemon=True,
+                    name="Fbref-event-loop",
+                )
+                self._loop_thread.start()
+                atexit.register(_close_at_exit, weakref.ref(self))
+            return self._loop
+
+    async def _acquire_tab(self):
+        """Return an idle tab of the current browser (starting it or opening a tab if needed)
+        and the browser generation it belongs to. Callers must hold a slot of _tab_slots,
+        which keeps the number of open tabs at max_tabs."""
+        async with self._browser_lock:
+            if self._browser is None:
+                browser = Chrome()
+                main_tab = await browser.start()
+                self._browser = browser
+                self._generation += 1
+                self._idle_tabs = [main_tab]
+            generation = self._generation
+            if self._idle_tabs:
+                return self._idle_tabs.pop(), generation
+            return await self._browser.new_tab(), generation
+
+    def _release_tab(self, tab, generation):
+        """Give the tab back to the pool, unless the browser was restarted while it was in use."""
+        if generation == self._generation:
+            self._idle_tabs.append(tab)
+
+    async def _stop_browser(self):
+        browser, self._browser = self._browser, None
+        self._generation += 1
+        self._idle_tabs = []
+        if browser is not None:
+            try:
+                await browser.stop()
+            except Exception:
+                pass
+
+    async def _restart_browser(self, generation):
+        """Drop a crashed browser. If several tabs fail together only the first one stops it,
+        the rest see the generation changed and retry on the new browser."""
+        async with self._browser_lock:
+            if generation == self._generation:
+                await self._stop_browser()
+
+    async def _replace_tab(self, tab, generation):
+        """Close a tab whose page failed and leave a fresh one in its place, so the next
+        attempt takes it from the pool without restarting the browser the other tabs use."""
+        async with self._browser_lock:
+            if generation != self._generation:
+                return
+            self._idle_tabs.append(await self._browser.new_tab())
+            await tab.close()
+
+    async def _recover(self, tab, generation, error):
+        """Restart the browser after a browser or connection error, replace the tab after a
+        page-level one. If the tab can't be replaced the browser is restarted as well."""
+        if tab is not None and not isinstance(error, _BROWSER_ERRORS):
+            try:
+                await self._replace_tab(tab, generation)
+                return
+            except Exception:
+                pass
+        await self._restart_browser(generation)
+
+    async def _wait_for_page(self, tab, timeout=_PAGE_READY_TIMEOUT):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            ready_state = await tab.execute_script("return document.readyState")
+            if ready_state == "complete":
+                body_length = await tab.execute_script(
+                    "return document.body ? document.body.innerHTML.length : 0;"
+                )
+                if isinstance(body_length, (int, float)) and body_length > 0:
+                    break
+            if loop.time() >= deadline:
+                break
+            await asyncio.sleep(_PAGE_READY_POLL_INTERVAL)
+
+    async def _get_html(self, full_url):
+        """Load full_url in a tab of the pool, trying up to _MAX_RETRIES times. If the browser
+        crashed it is restarted; if only the page failed it is retried on a fresh tab."""
+        if self._tab_slots is None:
+            self._tab_slots = asyncio.Semaphore(self.max_tabs)
+            self._browser_lock = asyncio.Lock()
+        host = PolitenessScheduler.host_key(full_url)
+        async with self._tab_slots:
+            for attempt in range(_MAX_RETRIES):
+                generation = self._generation
+                tab = None
+                try:
+                    tab, generation = await self._acquire_tab()
+                    await asyncio.sleep(self.scheduler.reserve(host))
+                    await tab.go_to(full_url, timeout=_PAGE_LOAD_TIMEOUT)
+                    await self._wait_for_page(tab)
+                    result = await tab.execute_script(
+                        "return document.documentElement.outerHTML;"
                     )
-                    if isinstance(value, str):
-                        html = value
-                    else:
-                        html = json.dumps(result, ensure_ascii=False)
+                    html = self._html_from_script_result(result)
+                except Exception as error:
+                    await self._recover(tab, generation, error)
+                    if attempt == _MAX_RETRIES - 1:
+                        raise
                 else:
-                    html = result
-
-                html = html.encode("utf-8", "ignore").decode("unicode_escape")
+                    self._release_tab(tab, generation)
+                    return html
+
+    def _html_from_script_result(self, result):
+        if isinstance(result, dict):
+            value = (
+                result.get("result", {})
+                    .get("result", {})
+                    .get("value")
+            )
+            if isinstance(value, str):
+                html = value
+            else:
+                html = json.dumps(result, ensure_ascii=False)
+        else:
+            html = result
 
-                return html
+        return html.encode("utf-8", "ignore").decode("unicode_escape")
 
-        def _execute_fetch():
-            return asyncio.run(_get_html())
+    def close(self):
+        """Close the browser and stop its event loop. A later request starts a new one.
 
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            return _execute_fetch()
-        else:
-            future = _HTML_FETCH_EXECUTOR.submit(_execute_fetch)
-            return future.result()
-         
-    def get_player_season_stats(self, stat, league, season=None, save_csv=False, add_page_name=False):
+        Usage:
+            fbref = Fbref()
+            # ... normal use ...
+            fbref.close()
+        """
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            if loop is None:
+                return
+            if loop.is_running():
+                try:
+                    asyncio.run_coroutine_threadsafe(self._stop_browser(), loop).result(timeout=15)
+                except Exception:
+                    pass
+                loop.call_soon_threadsafe(loop.stop)
+                self._loop_thread.join(timeout=5)
+            self._loop_thread = None
+            self._tab_slots = None
+            self._browser_lock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_player_season_stats(self, stat, league, season=None, save_csv=False, add_page_name=False, sink=None):
         """Get players season stats for a particular stat.
 
         Args:
@@ -357,7 +684,9 @@ class Fbref:
             season (str, optional): Possible season in get_available_season_for_leagues("Fbref", league). Defaults to None (that gets you the most recent season)
             save_csv (bool, optional): If true, it saves the tables as a csv. Defaults to False.
             add_page_name (bool, optional): If true it adds the stat name to all the columns. Defaults to False
-            
+            sink (str|OutputSink, optional): Also write the table with an OutputSink (a folder
+                means Parquet files in that folder). Defaults to None.
+
         Returns:
             df_data: DataFrame with the data for that particular stat selected as a param
         """
@@ -368,7 +697,19 @@ class Fbref:
         leagues = get_possible_leagues_for_page(league, season, 'Fbref')
         
         today = datetime.now().strftime('%Y-%m-%d')
+        path = self._player_stats_path(stat, league, season, leagues)
+        response = self.fbref_request(path)
+        df_data = self._player_stats_from_html(response, stat, league, add_page_name)
+
+        if save_csv:
+            df_data.to_csv(f'{league} - {stat} - {today}.csv')
+        sink = resolve_sink(sink)
+        if sink is not None:
+            sink.write(df_data, f'player_{stat}', 'Fbref', league, season)
         
+        return df_data
+
+    def _player_stats_path(self, stat, league, season, leagues):
         if league == 'Big 5 European Leagues' and season == None:
             path = f'/en/comps/{leagues[league]["id"]}/{stat}/players/{leagues[league]["slug"]}-Stats'
         elif league == 'Big 5 European Leagues' and season != None:
@@ -377,43 +718,22 @@ class Fbref:
             path = f'/en/comps/{leagues[league]["id"]}/{season}/{stat}/{season}/{leagues[league]["slug"]}-Stats'
         else:
             path = f'/en/comps/{leagues[league]["id"]}/{stat}/{leagues[league]["slug"]}-Stats'
+        return path
 
-        time.sleep(3)
-        
+    def _player_stats_from_html(self, response, stat, league, add_page_name=False):
         """Most of the code is from @BeGriffis (Twitter): 
         https://github.com/griffisben/griffis_soccer_analysis/blob/main/griffis_soccer_analysis/fbref_code.py
         """
-        response = self.fbref_request(path)
-        soup = BeautifulSoup(response, "html.parser")
-        data = []
-        headings = []
+        document = self.parser.parse(response)
         
         if league != 'Big 5 European Leagues':
-            comment = soup.find_all(text=lambda t: isinstance(t, Comment))
-            comment_number = 0
-            for i in range(len(comment)):
-                if comment[i].find('\n\n<div class="table_container"') != -1:
-                    comment_number = i
-            comment_table = comment[comment_number]
-            table = comment_table.find('table')
-            table_html = BeautifulSoup(comment_table[table:], 'html.parser')
-            table = self.get_table(table_html)
-            headtext = table_html.find_all("th", scope="col")
+            table = _TableIndex(document, self.parser).container_table()
         else:
-            table = self.get_table(soup)
-            headtext = soup.find_all("th", scope="col")
+            table = self.parser.tables(document)[0]
         
-        for header in headtext:
-            heading = header.get_text()
-            headings.append(heading)
+        headings = self.parser.header_cells(table, scope='col')
         headings = headings[1:len(headings)]
-        data.append(headings)
-        table_body = table.find('tbody')
-        rows = table_body.find_all('tr')
-
-        for row in rows:
-            cols = self.parse_row(row)
-            data.append(cols)
+        data = [headings] + self.parser.rows(table)
          
         df_data = pd.DataFrame(data)
         df_data = df_data.rename(columns=df_data.iloc[0])
@@ -424,55 +744,118 @@ class Fbref:
         if league != 'Big 5 European Leagues':
             df_data.insert(4, 'Comp', [league]*len(df_data))
         df_data = df_data.dropna().reset_index(drop=True)
-        df_data = df_data.map(self._fix_encoding)
+        df_data = self._convert_dtypes(df_data, _PLAYER_TEXT_COLUMNS)
 
         if add_page_name:
             new_columns = [f'{stat}_' + col if col != 'Player' else col for col in df_data.columns]
             df_data.columns = new_columns
-
-        if save_csv:
-            df_data.to_csv(f'{league} - {stat} - {today}.csv')
-        
         return df_data
 
-    def get_all_player_season_stats(self, league, season, save_csv=False):
+    def get_all_player_season_stats(self, league, season, save_csv=False, parse_workers=None, sink=None):
         """Gets a table of ALL the stats in a players page.
 
+        The pages are loaded at the same time in up to max_tabs browser tabs, parsed in
+        parallel worker processes and joined once on Player, Squad and Born.
+
         Args:
             league (str): Possible leagues in get_available_leagues("Fbref")
             save_csv (bool, optional): If true, it saves the tables as a csv. Defaults to False.
+            parse_workers (int, optional): Worker processes used to parse the pages. 0 parses them
+                in this process. Defaults to None (with the bs4 parser one per stat, up to the number
+                of CPUs; with lxml in this process).
+            sink (str|OutputSink, optional): Also write both tables with an OutputSink (a folder
+                means Parquet files in that folder). Defaults to None.
 
         Returns:
             data: DataFrame with all the stats of players
             gk_data: DataFrame with all the stats relevant to goalkeepers
         """
-        
+        print("Starting to scrape player data from Fbref...")
         today = datetime.now().strftime('%Y-%m-%d')
-        data = pd.DataFrame()
-        gk_data = pd.DataFrame()
+        leagues = get_possible_leagues_for_page(league, season, 'Fbref')
+        paths = []
         for stat in self.possible_stats:
-            print(stat)
-            if stat in ['keepers', 'keepersadv']:
-                placeholder = self.get_player_season_stats(f'{stat}',league, season, False, True)
-                if len(gk_data) == 0:
-                    gk_data = pd.concat([gk_data, placeholder], axis=1)
-                else:
-                    gk_data = gk_data.merge(placeholder, on='Player', how='left')
-            else:
-                placeholder = self.get_player_season_stats(f'{stat}',league, season, False, True)
-                if len(data) == 0:
-                    data = pd.concat([data, placeholder], axis=1)
-                else:
-                    data = data.merge(placeholder, on='Player', how='left')
-        
+            paths.append(self._player_stats_path(stat, league, season, leagues))
+        pages = self.fbref_request_many(paths)
+        frames = self._parse_stats_pages(
+            '_player_stats_from_html',
+            [(html, stat, league, True) for html, stat in zip(pages, self.possible_stats)],
+            parse_workers,
+        )
+
+        gk_stats = ['keepers', 'keepersadv']
+        gk_frames = [(s, frame) for s, frame in zip(self.possible_stats, frames) if s in gk_stats]
+        field_frames = [(s, frame) for s, frame in zip(self.possible_stats, frames) if s not in gk_stats]
+        #Players that played for two clubs in the same competition have one row per club
+        data = self._join_player_frames(field_frames)
+        gk_data = self._join_player_frames(gk_frames)
+
         if save_csv:
               data.to_csv(f'{league} - {stat} - player stats - {today}.csv')
-
-        #To avoid duplicates of players that played for two clubs in the same competition
-        data = data.drop_duplicates(subset=['Player', 'stats_Squad']).reset_index(drop=True)
-        gk_data = gk_data.drop_duplicates(subset=['Player', 'keepers_Squad']).reset_index(drop=True)
+        sink = resolve_sink(sink)
+        if sink is not None:
+            sink.write(data, 'player_stats', 'Fbref', league, season)
+            sink.write(gk_data, 'goalkeeper_stats', 'Fbref', league, season)
 
         return data, gk_data
+
+    def _join_player_frames(self, stat_frames):
+        keys = [
+            [frame[column] for column in ('Player', f'{stat}_Squad', f'{stat}_Born') if column in frame.columns]
+            for stat, frame in stat_frames
+        ]
+        frames = [frame for _, frame in stat_frames]
+        # Player is kept only from the first table, as the old merge on='Player' did
+        frames = frames[:1] + [frame.drop(columns='Player') for frame in frames[1:]]
+        return self._join_stat_frames(frames, keys)
+
+    def _join_stat_frames(self, frames, keys):
+        """Join stat tables of the same players/teams with a single concat, aligned on their keys.
+
+        Rows follow the first table (left join), duplicated keys keep their first row and
+        columns keep the names and order of each table, duplicates included.
+
+        Args:
+            frames (list): DataFrames to join.
+            keys (list): For each frame, the Series that identify its rows.
+
+        Returns:
+            DataFrame: Joined table.
+        """
+        if not frames:
+            return pd.DataFrame()
+        indexed = []
+        for frame, key in zip(frames, keys):
+            key_values = [column.astype(str) for column in key]
+            frame = frame.set_axis(pd.MultiIndex.from_arrays(key_values), axis=0)
+            indexed.append(frame[~frame.index.duplicated()])
+        index = indexed[0].index
+        data = pd.concat([indexed[0]] + [frame.reindex(index) for frame in indexed[1:]], axis=1)
+        return data.reset_index(drop=True)
+
+    def _parse_stats_pages(self, method_name, jobs, parse_workers=None):
+        """Parse several stats pages with method_name, in worker processes when possible.
+
+        Parsing the big FBref tables with bs4 is CPU bound, so it runs in parallel processes.
+        They are spawned, not forked: this process runs the browser's event loop thread and
+        forking it could copy a held lock. Measured on a 600 row players page (0.84 MB): bs4
+        parses it in ~1.2 s and lxml in ~0.2 s, sending the page to a worker and the DataFrame
+        back costs ~2 ms, and starting a spawned worker ~1.5 s. So the workers pay off for bs4
+        with 2 or more CPUs, while lxml parses the ~11 pages faster than the workers start and
+        stays in this process. If processes are not available (e.g. a script without an
+        if __name__ == '__main__' guard) it falls back to this process.
+        """
+        if parse_workers is None:
+            parse_workers = 0 if self.parser.name == 'lxml' else min(len(jobs), os.cpu_count() or 1)
+        if parse_workers > 1 and len(jobs) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                    futures = [executor.submit(_parse_stats_page, self.parser, method_name, *job) for job in jobs]
+                    return [future.result() for future in futures]
+            except (BrokenProcessPool, OSError, RuntimeError):
+                pass
+        method = getattr(self, method_name)
+        return [method(*job) for job in jobs]
     
     def get_slice_text_colors(self, player_df):
         sublists, sublist = [], []
@@ -499,15 +882,16 @@ class Fbref:
         Returns:
             player_df: DataFrame with the stats and values of the percentiles.
         """
-        self.player_info_exception(path)
-        player_df = pd.read_html(path)[0]
-        time.sleep(3)
-        return player_df
+        return self.page(path).get_player_percentiles()
     
     def get_all_dfs(self, path):
-        data = pd.read_html(path)
-        time.sleep(3)
-        return data
+        if self.cache is not None:
+            return self.cache.get_or_fetch(path, lambda: self._read_html(path), namespace='read_html')
+        return self._read_html(path)
+
+    def _read_html(self, path):
+        self.scheduler.wait(PolitenessScheduler.host_key(path))
+        return pd.read_html(path)
     
     def get_player_similarities(self, path):
         """Gets you a table of player similarities.
@@ -518,22 +902,13 @@ class Fbref:
         Returns:
             data: DataFrame with the names of the players similar.
         """
-        self.player_info_exception(path)
-        data = pd.read_html(path)[1]
-        time.sleep(3)
-        return data
+        return self.page(path).get_player_similarities()
     
     def get_match_shots(self, path):
-        self.match_info_exception(path)
-        data = self.get_all_dfs(path)[17]
-        data.columns = data.columns.droplevel(0)
-        return data
+        return self.page(path).get_match_shots()
     
     def get_general_match_team_stats(self, path):
-        self.match_info_exception(path)
-        data = self.get_all_dfs(path)
-        local_df, visit_df = data[3], data[10]
-        return local_df, visit_df
+        return self.page(path).get_general_match_team_stats()
 
     def get_tournament_table(self, path):
         """Gets you the table of the league.
@@ -544,5 +919,4 @@ class Fbref:
         Returns:
             data: DataFrame with the table.
         """
-        data = self.get_all_dfs(path)[0]
-        return data
\ No newline at end of file
+        return self.page(path).get_tournament_table()
\ No newline at end of file
@@ -8,6 +8,8 @@ import numpy as np
 import pandas as pd
 import nodriver as uc
 from .functions import get_possible_leagues_for_page, get_random_rate_sleep
+from .cache import resolve_cache, json_cacheable, CoalescingLRU, _match_status_ttl
+from .throttle import PolitenessScheduler
 from .exceptions import (
     InvalidStat, MatchDoesntHaveInfo,
     FotMobConnectionError, FotMobParseError, FotMobTimeoutError,
@@ -26,9 +28,15 @@ class _FotMobResponse:
         return self._data
 
 
+def _is_match_details(data):
+    """Solo se guardan en memoria los matchDetails reales, no errores ni challenges."""
+    return json_cacheable(data) and isinstance(data.get('general'), dict)
+
+
 class FotMob:
 
-    def __init__(self, request_delay: float = 1.0):
+    def __init__(self, request_delay: float = 1.0, cache=None, fetch_mode: str = 'page', max_tabs: int = 1,
+                 match_details_cache_size: int = 32):
         self.player_possible_stats = [
             'goals',
             'goal_assist',
@@ -94,10 +102,36 @@ class FotMob:
             'total_red_card_team',
         ]
 
+        if fetch_mode not in ['page', 'fetch']:
+            raise InvalidStat('fetch_mode', fetch_mode, ['page', 'fetch'])
+        if max_tabs < 1:
+            raise ValueError('max_tabs must be at least 1')
+
         self._browser = None
         self._warmed_up = False
         self.request_delay = request_delay
+        # Pool de pestañas sobre el mismo browser (el warm-up de Cloudflare se paga
+        # una sola vez). El scheduler limita el ritmo global de requests a FotMob.
+        self.max_tabs = max_tabs
+        self.scheduler = PolitenessScheduler(request_delay)
+        self._idle_tabs = []
+        self._tab_count = 0
+        self._generation = 0
+        self._browser_lock = None
+        # Avisa a las corrutinas que esperan pestaña cuando se libera una o cambia el browser.
+        self._tabs_changed = None
+        # 'page': navega a la URL y extrae el JSON del <pre> renderizado.
+        # 'fetch': hace fetch() desde la pestaña ya en fotmob.com y lee el body directo.
+        self.fetch_mode = fetch_mode
+        self.cache = resolve_cache(cache)
+        # matchDetails ya parseados por match id, compartidos por get_match_shotmap,
+        # get_team_colors, get_general_match_stats, etc. Si dos llamadas piden el mismo
+        # partido a la vez, la segunda espera a la primera en lugar de repetir la request.
+        # Los partidos terminados se guardan hasta que los desplaza el LRU; los que
+        # siguen en juego vencen al minuto, igual que en el ResponseCache.
+        self._match_details = CoalescingLRU(match_details_cache_size, ttl=_match_status_ttl)
         self._FETCH_TIMEOUT = 30   # seconds per request
+        self._TAB_WAIT_TIMEOUT = 3 * self._FETCH_TIMEOUT  # seconds waiting a tab without any being released
         self._WARMUP_WAIT = 5      # seconds to resolve Turnstile on homepage
         self._MAX_RETRIES = 3
 
@@ -131,21 +165,79 @@ class FotMob:
         self._browser = await uc.start()
         await self._browser.get("https://www.fotmob.com")
         await asyncio.sleep(self._WARMUP_WAIT)
+        self._generation += 1
+        self._idle_tabs = []
+        self._tab_count = 0
         self._warmed_up = True
         print("[FotMob] Browser listo.")
 
     async def _ensure_browser(self):
         """Garantiza que el browser esté corriendo y el warm-up esté hecho."""
-        if self._browser is None or not self._warmed_up:
-            await self._start_browser()
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+            self._tabs_changed = asyncio.Condition()
+        async with self._browser_lock:
+            if self._browser is None or not self._warmed_up:
+                try:
+                    await self._start_browser()
+                finally:
+                    await self._notify_tabs()
+
+    async def _notify_tabs(self):
+        """Despierta a las corrutinas que esperan una pestaña."""
+        async with self._tabs_changed:
+            self._tabs_changed.notify_all()
+
+    async def _acquire_tab(self):
+        """
+        Devuelve una pestaña libre del pool y la generación del browser al que
+        pertenece. La primera es la pestaña principal (ya en fotmob.com por el
+        warm-up); se abren pestañas nuevas hasta max_tabs y después se espera a
+        que se libere alguna o a que se reinicie el browser, como mucho
+        _TAB_WAIT_TIMEOUT segundos sin novedades.
+
+        Raises:
+            asyncio.TimeoutError: Si no se libera ninguna pestaña a tiempo.
+        """
+        while True:
+            async with self._tabs_changed:
+                while self._browser is not None and self._warmed_up and not self._idle_tabs and self._tab_count >= self.max_tabs:
+                    await asyncio.wait_for(self._tabs_changed.wait(), timeout=self._TAB_WAIT_TIMEOUT)
+                browser, generation = self._browser, self._generation
+                if browser is not None and self._warmed_up:
+                    if self._idle_tabs:
+                        return self._idle_tabs.pop(), generation
+                    self._tab_count += 1
+                    first_tab = self._tab_count == 1
+            if browser is None or not self._warmed_up:
+                # El browser se está reiniciando o falló: se espera al nuevo.
+                await self._ensure_browser()
+                continue
+            try:
+                if first_tab:
+                    return browser.main_tab, generation
+                return await browser.get("https://www.fotmob.com", new_tab=True), generation
+            except Exception:
+                if generation == self._generation:
+                    self._tab_count -= 1
+                    await self._notify_tabs()
+                raise
+
+    async def _release_tab(self, tab, generation):
+        """Devuelve la pestaña al pool, salvo que el browser se haya reiniciado mientras se usaba."""
+        if generation == self._generation:
+            self._idle_tabs.append(tab)
+            await self._notify_tabs()
 
-    def _submit(self, coro):
+    def _submit(self, coro, timeout=None):
         """
         Envía una corrutina al background loop y bloquea hasta obtener el resultado.
         Funciona desde cualquier contexto: script, Jupyter, función async, etc.
         """
         future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-        return future.result(timeout=self._FETCH_TIMEOUT + 15)
+        if timeout is None:
+            timeout = self._FETCH_TIMEOUT + 15
+        return future.result(timeout=timeout)
 
     def close(self):
         """
@@ -172,6 +264,7 @@ class FotMob:
         """
         Navega a `url` con nodriver y extrae el JSON de la respuesta.
 
+        - Con fetch_mode='fetch' primero intenta leer el body con fetch() desde la página.
         - Extrae el contenido del <pre> que devuelve el browser en endpoints JSON.
         - Si no hay <pre>, asume Cloudflare challenge y reintenta con espera incremental.
         - Si el browser se cae, lo detecta y reinicia antes de reintentar.
@@ -191,9 +284,26 @@ class FotMob:
         await self._ensure_browser()
 
         for attempt in range(1, self._MAX_RETRIES + 1):
+            generation = self._generation
+            tab = None
             try:
+                try:
+                    tab, generation = await self._acquire_tab()
+                except asyncio.TimeoutError:
+                    # Ninguna pestaña se liberó: no es culpa del browser, no se reinicia.
+                    raise FotMobTimeoutError(url)
+                await asyncio.sleep(self.scheduler.reserve('www.fotmob.com'))
+
+                if self.fetch_mode == 'fetch':
+                    data = await asyncio.wait_for(
+                        self._fetch_in_page(tab, url),
+                        timeout=self._FETCH_TIMEOUT,
+                    )
+                    if data is not None:
+                        return data
+
                 page = await asyncio.wait_for(
-                    self._browser.get(url),
+                    tab.get(url),
                     timeout=self._FETCH_TIMEOUT,
                 )
                 await asyncio.sleep(2)  # espera mínima para que cargue el contenido
@@ -221,7 +331,7 @@ class FotMob:
             except asyncio.TimeoutError:
                 if attempt < self._MAX_RETRIES:
                     print(f"[FotMob] Timeout, reiniciando browser (intento {attempt}/{self._MAX_RETRIES})...")
-                    await self._restart_browser()
+                    await self._restart_browser(generation)
                     continue
                 raise FotMobTimeoutError(url)
 
@@ -231,10 +341,36 @@ class FotMob:
             except Exception as e:
                 if attempt < self._MAX_RETRIES:
                     print(f"[FotMob] Error de browser ({type(e).__name__}: {e}), reiniciando (intento {attempt}/{self._MAX_RETRIES})...")
-                    await self._restart_browser()
+                    await self._restart_browser(generation)
                     continue
                 raise
 
+            finally:
+                if tab is not None:
+                    await self._release_tab(tab, generation)
+
+    async def _fetch_in_page(self, tab, url: str):
+        """
+        Ejecuta fetch(url) dentro de la pestaña (que ya está en el origen de
+        FotMob después del warm-up) y parsea el body directamente, sin renderizar
+        el JSON como página ni buscar el <pre> en el HTML.
+
+        Returns:
+            dict | None: JSON parseado, o None si el fetch falló o no devolvió JSON
+            (por ejemplo un challenge de Cloudflare), para caer al modo 'page'.
+        """
+        result = await tab.evaluate(
+            f"fetch({json.dumps(url)}, {{credentials: 'include'}}).then(r => r.text())",
+            await_promise=True,
+            return_by_value=True,
+        )
+        if not isinstance(result, str):
+            return None
+        try:
+            return json.loads(result)
+        except json.JSONDecodeError:
+            return None
+
     def _reset_browser(self):
         """Marca el browser como inválido para forzar un reinicio en el próximo fetch."""
         try:
@@ -243,11 +379,25 @@ class FotMob:
             pass
         self._browser = None
         self._warmed_up = False
+        self._generation += 1
+        self._idle_tabs = []
+        self._tab_count = 0
 
-    async def _restart_browser(self):
-        """Resetea el estado del browser y lo reinicia con warm-up."""
-        self._reset_browser()
-        await self._start_browser()
+    async def _restart_browser(self, generation=None):
+        """
+        Resetea el estado del browser y lo reinicia con warm-up. Si varias pestañas
+        fallan a la vez, solo la primera reinicia: las demás ven que la generación
+        del browser ya cambió y reintentan sobre el browser nuevo.
+        """
+        async with self._browser_lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._reset_browser()
+            try:
+                await self._start_browser()
+            finally:
+                # Las que esperaban pestaña del browser anterior siguen con el nuevo.
+                await self._notify_tabs()
 
     def _fetch(self, url: str) -> dict:
         """
@@ -274,9 +424,90 @@ class FotMob:
             _FotMobResponse: Objeto con método .json() que retorna el dict de la respuesta.
         """
         url = f'https://www.fotmob.com/api/data/{path}'
+        if self.cache is None:
+            return _FotMobResponse(self._fetch_with_delay(url))
+        return _FotMobResponse(self.cache.get_or_fetch(url, lambda: self._fetch_with_delay(url), cacheable=json_cacheable))
+
+    async def fetch_many_async(self, paths, return_exceptions=False):
+        """
+        Versión async de fetch_many, para usar con await desde código async propio.
+        Las requests igual corren en el background loop de FotMob y el cache se
+        lee y escribe en un thread aparte, sin bloquear el loop.
+        """
+        loop = asyncio.get_running_loop()
+        urls = [f'https://www.fotmob.com/api/data/{path}' for path in paths]
+        results, pending = await loop.run_in_executor(None, self._cached_results, urls)
+        fetched = await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._async_fetch_urls(list(pending)), self._loop)
+        )
+        return await loop.run_in_executor(None, self._merge_fetched, results, pending, fetched, return_exceptions)
+
+    def fetch_many(self, paths, return_exceptions=False):
+        """
+        Hace varias requests a la API de FotMob en paralelo, usando hasta max_tabs
+        pestañas del mismo browser con el ritmo global de request_delay.
+
+        Un path que falla no descarta a los demás: las respuestas que llegaron
+        se guardan en el cache igual, así reintentar solo pide lo que falló.
+
+        Args:
+            paths (list): Paths de la API (sin la base URL), igual que en fotmob_request.
+            return_exceptions (bool, optional): Devolver la excepción de cada path que falló
+                en su lugar de la lista en vez de lanzar la primera. Defaults to False.
+
+        Returns:
+            list: _FotMobResponse de cada path (o la excepción, con return_exceptions),
+                en el mismo orden que paths.
+        """
+        urls = [f'https://www.fotmob.com/api/data/{path}' for path in paths]
+        results, pending = self._cached_results(urls)
+        rounds = max(1, -(-len(pending) // self.max_tabs))
+        timeout = (self._FETCH_TIMEOUT + 15) * self._MAX_RETRIES * rounds
+        fetched = self._submit(self._async_fetch_urls(list(pending)), timeout=timeout)
+        return self._merge_fetched(results, pending, fetched, return_exceptions)
+
+    def _cached_results(self, urls):
+        """Respuestas que ya están en el cache y, por URL, los índices que faltan pedir."""
+        results = [None] * len(urls)
+        pending = {}
+        for index, url in enumerate(urls):
+            cached = self.cache.get(self.cache.make_key(url)) if self.cache is not None else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(url, []).append(index)
+        return results, pending
+
+    def _merge_fetched(self, results, pending, fetched, return_exceptions=False):
+        """Guarda en el cache las respuestas válidas (igual que fotmob_request) y arma la lista final."""
+        for (url, indexes), data in zip(pending.items(), fetched):
+            if isinstance(data, BaseException):
+                response = data
+            else:
+                if self.cache is not None and json_cacheable(data):
+                    self.cache.set(self.cache.make_key(url), data)
+                response = _FotMobResponse(data)
+            for index in indexes:
+                results[index] = response
+        for index, data in enumerate(results):
+            if isinstance(data, dict):
+                results[index] = _FotMobResponse(data)
+            elif isinstance(data, BaseException) and not return_exceptions:
+                raise data
+        return results
+
+    async def _async_fetch_urls(self, urls):
+        # Cada URL termina por su cuenta: una que falla no cancela a las demás.
+        return await asyncio.gather(*(self._async_fetch(url) for url in urls), return_exceptions=True)
+
+    def _fetch_with_delay(self, url: str) -> dict:
+        """
+        Igual que _fetch pero respetando request_delay después de la request.
+        Se usa solo cuando la respuesta no está en el cache.
+        """
         data = self._fetch(url)
         time.sleep(self.request_delay)
-        return _FotMobResponse(data)
+        return data
 
     # ─── Public methods (interfaz sin cambios) ────────────────────────────────
 
@@ -321,8 +552,40 @@ class FotMob:
             _FotMobResponse: Object with .json() returning the full match details dict.
         """
         path = f'matchDetails?matchId={match_id}'
-        response = self.fotmob_request(path)
-        return response
+        data = self._match_details.get_or_compute(
+            str(match_id), lambda: self.fotmob_request(path).json(), cacheable=_is_match_details,
+        )
+        return _FotMobResponse(data)
+
+    def request_match_details_many(self, match_ids):
+        """Get match details for several matches at once, in parallel tabs (see max_tabs).
+
+        Args:
+            match_ids (list): Ids of matches, could be found in the URL.
+
+        Returns:
+            list: _FotMobResponse for each match, in the same order as match_ids.
+        """
+        match_ids = [str(match_id) for match_id in match_ids]
+        missing = [match_id for match_id in dict.fromkeys(match_ids) if match_id not in self._match_details]
+        if len(missing) > 1:
+            # Los que fallan o no son detalles de partido se vuelven a pedir de a uno abajo.
+            responses = self.fetch_many([f'matchDetails?matchId={match_id}' for match_id in missing], return_exceptions=True)
+            for match_id, response in zip(missing, responses):
+                if isinstance(response, _FotMobResponse) and _is_match_details(response.json()):
+                    self._match_details.put(match_id, response.json())
+        return [self.request_match_details(match_id) for match_id in match_ids]
+
+    def clear_match_details(self, match_id=None):
+        """Forget the match details kept in memory, so the next call requests them again.
+
+        Args:
+            match_id (str, optional): Id of the match to forget. Defaults to None (every match).
+        """
+        if match_id is None:
+            self._match_details.clear()
+        else:
+            self._match_details.invalidate(str(match_id))
 
     def get_players_stats_season(self, league, season, stat):
         """Get players stats for a certain season and league. Possible stats are player_possible_stats.
@@ -0,0 +1,144 @@
+import difflib
+import json
+import os
+import pathlib
+import threading
+from types import MappingProxyType
+from .exceptions import InvalidLeagueException, InvalidSeasonException, InvalidStrType
+
+DEFAULT_LEAGUES_PATH = pathlib.Path(__file__).parent / 'data' / 'leagues.json'
+# Point this variable to another leagues.json to add leagues or seasons without a new release
+LEAGUES_PATH_ENV = 'LANUSSTATS_LEAGUES_PATH'
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class LeagueRegistry:
+    """Read-only index of the pages, leagues and seasons supported by the scrapers.
+
+    It is built once from a leagues.json file (page -> league -> id/slug/seasons) and
+    answers every lookup from dictionaries, including the reverse lookup by id.
+
+    Usage:
+        registry = get_registry()
+        registry.league('Fbref', 'Primera Division Argentina')['id']
+        registry.by_id('Sofascore', 155)
+        registry.find('premier')
+
+    Args:
+        data (dict): Leagues by page, with the format of leagues.json.
+    """
+
+    def __init__(self, data):
+        self._pages = _freeze(data)
+        self._by_id = {}
+        for page, leagues in self._pages.items():
+            for league, info in leagues.items():
+                if 'id' in info:
+                    self._by_id.setdefault((page, str(info['id'])), league)
+        self._names = {league.lower(): league for leagues in self._pages.values() for league in leagues}
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding='utf-8') as file:
+            return cls(json.load(file))
+
+    @property
+    def pages(self):
+        """Mapping page -> league -> league data."""
+        return self._pages
+
+    def leagues(self, page):
+        """Mapping league -> league data of a page (raises KeyError for an unknown page)."""
+        return self._pages[page]
+
+    def league(self, page, league):
+        """Data of a league (id, slug, seasons) in a page.
+
+        Raises:
+            InvalidLeagueException: If the league is not available for that page.
+        """
+        leagues = self._pages[page]
+        if league not in leagues:
+            raise InvalidLeagueException(league, list(leagues))
+        return leagues[league]
+
+    def seasons(self, page, league):
+        """Seasons of a league: a tuple, a mapping season -> id or None if the page has no seasons."""
+        return self.league(page, league).get('seasons')
+
+    def by_id(self, page, league_id):
+        """Name of the league of a page with that id, or None."""
+        return self._by_id.get((page, str(league_id)))
+
+    def find(self, name, page=None, n=5, cutoff=0.6):
+        """Leagues with a name similar to name, best matches first.
+
+        Args:
+            name (str): Name or part of the name of a league (case insensitive).
+            page (str, optional): Only look at the leagues of that page. Defaults to None (all pages).
+            n (int, optional): Maximum number of results. Defaults to 5.
+            cutoff (float, optional): Minimum similarity, between 0 and 1. Defaults to 0.6.
+
+        Returns:
+            list: Names of the leagues.
+        """
+        names = self._names if page is None else {league.lower(): league for league in self._pages[page]}
+        query = name.lower()
+        contained = [names[key] for key in names if query in key]
+        close = [names[key] for key in difflib.get_close_matches(query, names, n=n, cutoff=cutoff)]
+        return list(dict.fromkeys(close + contained))[:n]
+
+    def validate(self, league, season, page):
+        """Check the league and season params of a scraper method.
+
+        Raises:
+            InvalidStrType: If a parameter is not a string
+            InvalidLeagueException: If a league is not inside all the leagues possibles
+            InvalidSeasonException: If a season is not inside all the seasons possibles
+        """
+        if season is not None and type(season) != str:
+            raise InvalidStrType(season)
+        if type(league) != str:
+            raise InvalidStrType(league)
+        seasons = self.seasons(page, league)
+        if seasons is not None and season is not None and season not in seasons:
+            raise InvalidSeasonException(season, list(seasons))
+
+
+def get_registry():
+    """The shared LeagueRegistry, loaded the first time it is needed.
+
+    It reads the file in the LANUSSTATS_LEAGUES_PATH environment variable if it is set,
+    or the leagues.json shipped with the package.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LeagueRegistry.from_file(os.environ.get(LEAGUES_PATH_ENV) or DEFAULT_LEAGUES_PATH)
+    return _registry
+
+
+def reload_registry(path=None):
+    """Load the leagues again, from path or as get_registry() does, and use them from now on.
+
+    Args:
+        path (str, optional): Path of a leagues.json file. Defaults to None.
+
+    Returns:
+        LeagueRegistry: The new registry.
+    """
+    global _registry
+    with _registry_lock:
+        _registry = LeagueRegistry.from_file(path or os.environ.get(LEAGUES_PATH_ENV) or DEFAULT_LEAGUES_PATH)
+    return _registry
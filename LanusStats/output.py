@@ -0,0 +1,217 @@
+import json
+import os
+import pathlib
+import tempfile
+from datetime import datetime
+from urllib.parse import quote, unquote
+import pandas as pd
+from .exceptions import InvalidStat
+
+# Value of a partition without value (e.g. season=None), the same pyarrow and Spark use
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+PARTITION_KEYS = ['source', 'league', 'season', 'date']
+
+# format -> (file extension, compressions accepted, default compression)
+FORMATS = {
+    'parquet': ('.parquet', ['snappy', 'zstd', 'gzip', 'brotli', 'lz4', None], 'snappy'),
+    'feather': ('.feather', ['lz4', 'zstd', None], 'lz4'),
+    'csv': ('.csv', ['gzip', 'bz2', 'zip', 'xz', 'zstd', None], None),
+}
+_CSV_EXTENSIONS = {'gzip': '.gz', 'bz2': '.bz2', 'zip': '.zip', 'xz': '.xz', 'zstd': '.zst'}
+_MISSING = object()
+
+
+def _partition_value(value):
+    if value is None:
+        return NULL_PARTITION
+    # Encoded like pyarrow's hive partitioning expects (keeps spaces readable)
+    return quote(str(value), safe=" ()',&+")
+
+
+def _unique_columns(columns):
+    """Column names as unique strings: Parquet and Arrow do not accept repeated or non-str names."""
+    names = []
+    seen = {}
+    for column in columns:
+        name = '_'.join(str(part) for part in column if str(part)) if isinstance(column, tuple) else str(column)
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _arrow_safe_column(column):
+    """Object columns with dicts/lists (raw API payloads) become JSON, mixed scalars become text."""
+    if column.dtype != object:
+        return column
+    values = column.dropna()
+    types = set(map(type, values))
+    if types <= {str}:
+        return column
+    if types & {dict, list}:
+        return column.map(lambda value: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value).astype('string')
+    if len(types) > 1:
+        return column.astype('string')
+    return column
+
+
+class OutputSink:
+    """Writes the DataFrames of the scrapers as Parquet, Feather (Arrow IPC) or CSV files.
+
+    The files are stored with a hive-style layout, so a whole source, league or season
+    can be read back at once with pd.read_parquet or pyarrow.dataset:
+
+        root/source=Fbref/league=Premier League/season=2023-2024/date=2024-05-20/shooting.parquet
+
+    Usage:
+        sink = OutputSink('data', format='parquet', compression='zstd')
+        fbref.get_player_season_stats('shooting', 'Premier League', sink=sink)
+        sink.read('shooting', source='Fbref')
+
+    Args:
+        root (str, optional): Folder where the files are written. Defaults to '.'.
+        format (str, optional): 'parquet', 'feather' or 'csv'. Defaults to 'parquet'.
+        compression (str, optional): Compression of the files, depends on the format. Defaults to
+            snappy for parquet, lz4 for feather and none for csv.
+        dtypes (dict, optional): Column -> dtype applied to every table before writing it
+            (columns that a table does not have are skipped). Defaults to None.
+    """
+
+    def __init__(self, root='.', format='parquet', compression=_MISSING, dtypes=None):
+        if format not in FORMATS:
+            raise InvalidStat('format', format, list(FORMATS))
+        extension, compressions, default_compression = FORMATS[format]
+        if compression is _MISSING:
+            compression = default_compression
+        if compression not in compressions:
+            raise InvalidStat('compression', compression, compressions)
+        self.root = pathlib.Path(root)
+        self.format = format
+        self.compression = compression
+        self.dtypes = dict(dtypes or {})
+        self.extension = extension + (_CSV_EXTENSIONS.get(compression, '') if format == 'csv' else '')
+
+    def path(self, name, source, league=None, season=None, date=None, part=None):
+        """Path of the file of a table.
+
+        Args:
+            name (str): Name of the table (e.g. 'shooting', 'team_stats').
+            source (str): Page the data comes from (e.g. 'Fbref').
+            league (str, optional): League of the data. Defaults to None.
+            season (str, optional): Season of the data. Defaults to None.
+            date (str, optional): Date of the scrape. Defaults to None (today, YYYY-MM-DD).
+            part (str, optional): For tables written in several files (e.g. one per match), the
+                file inside the folder of the table. Defaults to None (a single file).
+
+        Returns:
+            pathlib.Path: Path of the file.
+        """
+        date = date or datetime.now().strftime('%Y-%m-%d')
+        values = [source, league, season, date]
+        folder = self.root.joinpath(*[f'{key}={_partition_value(value)}' for key, value in zip(PARTITION_KEYS, values)])
+        if part is not None:
+            return folder / _partition_value(name) / f'{_partition_value(part)}{self.extension}'
+        return folder / f'{_partition_value(name)}{self.extension}'
+
+    def prepare(self, df, dtypes=None):
+        """The DataFrame as it will be written: unique str column names, the dtypes of the sink
+        (and the dtypes param) applied and columns with nested payloads as JSON text.
+        """
+        df = df.copy()
+        df.columns = _unique_columns(df.columns)
+        dtypes = {**self.dtypes, **(dtypes or {})}
+        dtypes = {column: dtype for column, dtype in dtypes.items() if column in df.columns}
+        if dtypes:
+            df = df.astype(dtypes)
+        if self.format != 'csv':
+            for position in range(df.shape[1]):
+                df.isetitem(position, _arrow_safe_column(df.iloc[:, position]))
+            if not isinstance(df.index, pd.RangeIndex):
+                df = df.reset_index(drop=True)
+        return df
+
+    def write(self, df, name, source, league=None, season=None, date=None, dtypes=None, part=None):
+        """Write a table. The file of the same table, source, league, season and date is replaced.
+
+        Args:
+            df (DataFrame): Table to write.
+            name (str): Name of the table.
+            source (str): Page the data comes from.
+            league (str, optional): League of the data. Defaults to None.
+            season (str, optional): Season of the data. Defaults to None.
+            date (str, optional): Date of the scrape. Defaults to None (today).
+            dtypes (dict, optional): Column -> dtype only for this table. Defaults to None.
+            part (str, optional): Write one file of a table split in several (see path). Defaults to None.
+
+        Returns:
+            pathlib.Path: Path of the written file.
+        """
+        path = self.path(name, source, league, season, date, part)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df = self.prepare(df, dtypes)
+        # Written next to the final file and moved, so readers never see half a file
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        os.close(descriptor)
+        try:
+            if self.format == 'parquet':
+                df.to_parquet(temporary, compression=self.compression, index=False)
+            elif self.format == 'feather':
+                df.to_feather(temporary, compression=self.compression or 'uncompressed')
+            else:
+                df.to_csv(temporary, index=False, compression=self.compression)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        return path
+
+    def read(self, name, source=None, league=None, season=None, date=None):
+        """Read back every file of a table, optionally only of a source, league, season or date.
+
+        The partition values are added as columns (source, league, season, date).
+
+        Returns:
+            DataFrame: The tables one after the other, or an empty DataFrame if there are none.
+        """
+        filters = dict(zip(PARTITION_KEYS, [source, league, season, date]))
+        frames = []
+        name = _partition_value(name)
+        paths = list(self.root.glob(f'**/{name}{self.extension}')) + list(self.root.glob(f'**/{name}/*{self.extension}'))
+        for path in sorted(paths):
+            partitions = {}
+            for part in path.relative_to(self.root).parent.parts:
+                key, _, value = part.partition('=')
+                if key in filters:
+                    partitions[key] = None if value == NULL_PARTITION else unquote(value)
+            if any(value is not None and partitions.get(key) != str(value) for key, value in filters.items()):
+                continue
+            if self.format == 'parquet':
+                frame = pd.read_parquet(path)
+            elif self.format == 'feather':
+                frame = pd.read_feather(path)
+            else:
+                frame = pd.read_csv(path)
+            frames.append(frame.assign(**partitions))
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+
+def resolve_sink(sink):
+    """Turn the sink= option of the scraper methods into an OutputSink (or None).
+
+    Args:
+        sink (None|str|OutputSink): None writes nothing, a string is the root folder of a
+            Parquet OutputSink and an OutputSink instance is used as is.
+
+    Returns:
+        OutputSink or None.
+    """
+    if sink is None or sink is False:
+        return None
+    if isinstance(sink, (str, os.PathLike)):
+        return OutputSink(root=sink)
+    return sink
@@ -0,0 +1,204 @@
+from bs4 import BeautifulSoup, Comment
+from .exceptions import InvalidStat
+
+
+class BeautifulSoupParser:
+    """Table parser backed by BeautifulSoup and the standard library html.parser.
+
+    Always available and the default of Fbref and Transfermarkt.
+    """
+
+    name = 'bs4'
+
+    def parse(self, html):
+        return BeautifulSoup(html, 'html.parser')
+
+    def tables(self, document):
+        return document.find_all('table')
+
+    def tables_with_class(self, document, class_name):
+        return document.find_all('table', {'class': class_name})
+
+    def comments(self, document):
+        return [str(comment) for comment in document.find_all(string=lambda text: isinstance(text, Comment))]
+
+    def text(self, element):
+        return element.get_text()
+
+    def header_cells(self, table, scope=None):
+        """Text of the <th> of a table, optionally only the ones with a certain scope."""
+        headers = table.find_all('th', scope=scope) if scope else table.find_all('th')
+        return [header.get_text() for header in headers]
+
+    def headings(self, table):
+        """Column headings from <thead>, skipping helper headers (over_header, row headers)."""
+        source = table.find('thead') or table
+        headings = []
+        for th in source.find_all('th'):
+            if 'over_header' in th.get('class', []):
+                continue
+            scope = th.get('scope')
+            if scope and scope not in {'col', 'colgroup'}:
+                continue
+            text = th.get_text(strip=True)
+            if text:
+                headings.append(text)
+        return headings
+
+    def rows(self, table, row_header=False, strip_pieces=False, images=False):
+        """Cells of every body row of a table.
+
+        Args:
+            table: Table element returned by this parser.
+            row_header (bool, optional): Put the text of the row <th> (e.g. the squad) as first
+                cell and skip rows without any value. Defaults to False.
+            strip_pieces (bool, optional): Strip each text piece of a cell instead of the whole
+                text, like get_text(strip=True). Defaults to False.
+            images (bool, optional): Cells with an image give the src of the image. Defaults to False.
+
+        Returns:
+            list: One list of strings per row.
+        """
+        body = table.find('tbody') or table
+        rows = []
+        for row in body.find_all('tr'):
+            cells = []
+            for cell in row.find_all('td'):
+                image = cell.find('img') if images else None
+                if image is not None:
+                    cells.append(image['src'])
+                elif strip_pieces:
+                    cells.append(cell.get_text(strip=True))
+                else:
+                    cells.append(cell.text.strip())
+            if row_header:
+                th = row.find('th', attrs={'data-stat': 'squad'}) or row.find('th', scope='row') or row.find('th')
+                cells = [th.get_text(strip=True) if th else ''] + cells
+                if not any(cells):
+                    continue
+            rows.append(cells)
+        return rows
+
+
+class LxmlParser:
+    """Table parser backed by lxml. It reads cells straight from the C tree, several times
+    faster than BeautifulSoup on the big FBref and Transfermarkt pages.
+
+    Needs lxml (pip install lanusstats[fast]).
+    """
+
+    name = 'lxml'
+
+    def __init__(self):
+        try:
+            import lxml.html
+        except ImportError:
+            raise ImportError("The 'lxml' parser needs lxml installed: pip install lxml") from None
+        self._html = lxml.html
+
+    # The parsed module is not picklable, workers import it again
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    def parse(self, html):
+        # Without a <meta charset> lxml reads bytes as latin-1, BeautifulSoup sniffs them
+        if isinstance(html, bytes):
+            try:
+                html = html.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+        return self._html.document_fromstring(html)
+
+    def tables(self, document):
+        return list(document.iter('table'))
+
+    def tables_with_class(self, document, class_name):
+        return [table for table in document.iter('table') if class_name in table.get('class', '').split()]
+
+    def comments(self, document):
+        return [comment.text or '' for comment in document.xpath('//comment()')]
+
+    def text(self, element):
+        return ''.join(element.itertext())
+
+    def _stripped_text(self, element):
+        return ''.join(piece.strip() for piece in element.itertext())
+
+    def _first(self, element, tag):
+        return next(element.iter(tag), None)
+
+    def header_cells(self, table, scope=None):
+        return [self.text(th) for th in table.iter('th') if scope is None or th.get('scope') == scope]
+
+    def headings(self, table):
+        source = self._first(table, 'thead')
+        if source is None:
+            source = table
+        headings = []
+        for th in source.iter('th'):
+            if 'over_header' in th.get('class', '').split():
+                continue
+            scope = th.get('scope')
+            if scope and scope not in {'col', 'colgroup'}:
+                continue
+            text = self._stripped_text(th)
+            if text:
+                headings.append(text)
+        return headings
+
+    def rows(self, table, row_header=False, strip_pieces=False, images=False):
+        body = self._first(table, 'tbody')
+        if body is None:
+            body = table
+        rows = []
+        for row in body.iter('tr'):
+            cells = []
+            for cell in row.iter('td'):
+                image = self._first(cell, 'img') if images else None
+                if image is not None:
+                    cells.append(image.get('src'))
+                elif strip_pieces:
+                    cells.append(self._stripped_text(cell))
+                else:
+                    cells.append(self.text(cell).strip())
+            if row_header:
+                cells = [self._row_header(row)] + cells
+                if not any(cells):
+                    continue
+            rows.append(cells)
+        return rows
+
+    def _row_header(self, row):
+        headers = list(row.iter('th'))
+        if not headers:
+            return ''
+        th = next((th for th in headers if th.get('data-stat') == 'squad'), None)
+        if th is None:
+            th = next((th for th in headers if th.get('scope') == 'row'), headers[0])
+        return self._stripped_text(th)
+
+
+PARSERS = {
+    'bs4': BeautifulSoupParser,
+    'lxml': LxmlParser,
+}
+
+
+def get_parser(parser='bs4'):
+    """Resolve the parser= option of Fbref and Transfermarkt.
+
+    Args:
+        parser (str|object, optional): 'bs4', 'lxml' or a parser instance with the same
+            methods as BeautifulSoupParser. Defaults to 'bs4'.
+
+    Returns:
+        Parser instance.
+    """
+    if not isinstance(parser, str):
+        return parser
+    if parser not in PARSERS:
+        raise InvalidStat('parser', parser, list(PARSERS))
+    return PARSERS[parser]()
@@ -0,0 +1,38 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Responses worth retrying: rate limited or a temporary problem of the server
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+
+def make_session(headers=None, pool_size=10, max_retries=3, backoff_factor=1):
+    """requests.Session that keeps the connections open between requests and retries
+    failed GETs with exponential backoff (1s, 2s, 4s, ... with backoff_factor=1),
+    respecting the Retry-After header of 429/503 responses.
+
+    Args:
+        headers (dict, optional): Headers sent with every request. Defaults to None.
+        pool_size (int, optional): Connections kept open per host, use at least the number
+            of threads sharing the session. Defaults to 10.
+        max_retries (int, optional): Retries of a request after connection errors or
+            RETRY_STATUSES. Defaults to 3.
+        backoff_factor (float, optional): Base of the wait between retries. Defaults to 1.
+
+    Returns:
+        requests.Session: Session safe to share between threads for GET requests.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
@@ -5,8 +5,17 @@ import sys
 import numpy as np
 from datetime import datetime
 import time
-from .functions import get_possible_leagues_for_page, pd, uc, get_random_rate_sleep
-from .exceptions import InvalidStrType, MatchDoesntHaveInfo, PlayerDoesntHaveInfo
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import undetected_chromedriver as uc
+from .functions import get_possible_leagues_for_page
+from .cache import resolve_cache, json_cacheable, CoalescingLRU
+from .output import resolve_sink
+from .throttle import PolitenessScheduler
+from .exceptions import InvalidStat, InvalidStrType, MatchDoesntHaveInfo, PlayerDoesntHaveInfo
+from selenium.common.exceptions import WebDriverException
 from faker import Faker
 from faker.providers import user_agent
 from bs4 import BeautifulSoup
@@ -58,14 +67,255 @@ def _get_system_chromedriver_path():
     return None
 
 
+_PAGE_READY_TIMEOUT = 12
+_PAGE_READY_POLL_INTERVAL = 0.25
+
+# Runs inside the page (already on www.sofascore.com) so the API response body
+# arrives as text, without rendering it as a document and scraping it back.
+_IN_PAGE_FETCH_SCRIPT = """
+const done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'include'})
+    .then(response => response.text().then(body => done({status: response.status, body: body})))
+    .catch(error => done({status: 0, body: String(error)}));
+"""
+
+
 fake = Faker()
 fake.add_provider(user_agent)
 
 user_agent_provider = fake.user_agent
 
+
+class _DriverSlot:
+    """One browser of the SofaScore driver pool. Only the thread holding the slot uses its driver."""
+    def __init__(self, index):
+        self.index = index
+        self.driver = None
+        self.warmed_up = False
+
+
+class SofaScoreMatch:
+    """Data of a single SofaScore match, shared by all the match accessors.
+
+    Every sub-resource of the match (event, lineups, shotmap, ...) is requested at
+    most once and the DataFrames are built from that shared state. Get one with
+    SofaScore.match(match_url).
+
+    Usage:
+        match = sofascore.match(match_url)
+        for player in match.get_player_ids():
+            heatmap = match.get_player_heatmap(player)
+    """
+
+    def __init__(self, sofascore, match_url):
+        self.sofascore = sofascore
+        self.match_url = match_url
+        self.match_id = sofascore.get_match_id(match_url)
+        # Keyed by resource: different resources are requested in parallel, the same one only once.
+        self._resources = CoalescingLRU(maxsize=None)
+
+    def _path(self, resource):
+        return f'api/v1/event/{self.match_id}/{resource}' if resource else f'api/v1/event/{self.match_id}'
+
+    def get_resource(self, resource=''):
+        """Get a sub-resource of the match, requesting it only the first time.
+
+        Args:
+            resource (str, optional): Part of the path after api/v1/event/{match_id}/.
+                Ex: 'lineups', 'shotmap', 'player/{player_id}/heatmap'. Defaults to '' (the event itself).
+
+        Returns:
+            dict: JSON of the response.
+        """
+        return self._resources.get_or_compute(resource, lambda: self.sofascore.sofascore_request(self._path(resource)))
+
+    def prefetch(self, resources):
+        """Request several sub-resources at once, spread over the SofaScore pool of browsers.
+
+        Args:
+            resources (list): Sub-resources as in get_resource().
+        """
+        missing = [resource for resource in dict.fromkeys(resources) if resource not in self._resources]
+        if not missing:
+            return
+        responses = self.sofascore.fetch_many([self._path(resource) for resource in missing])
+        for resource, data in zip(missing, responses):
+            if resource not in self._resources:
+                self._resources.put(resource, data)
+
+    @property
+    def event(self):
+        return self.get_resource('')
+
+    @property
+    def lineups(self):
+        return self.get_resource('lineups')
+
+    def get_team_names(self):
+        try:
+            home_team = self.event['event']['homeTeam']['name']
+        except KeyError:
+            raise MatchDoesntHaveInfo(self.match_url)
+        away_team = self.event['event']['awayTeam']['name']
+        return home_team, away_team
+
+    def get_player_ids(self):
+        player_ids = {}
+        for team in ['home', 'away']:
+            for item in self.lineups[team]['players']:
+                player_data = item['player']
+                player_ids[player_data['name']] = player_data['id']
+        return player_ids
+
+    def get_match_momentum(self):
+        data = self.get_resource('graph')
+        try:
+            points = data['graphPoints']
+        except KeyError:
+            raise MatchDoesntHaveInfo(self.match_url)
+        return pd.DataFrame(points)
+
+    def get_match_shotmap(self, save_csv=False, sink=None):
+        data = self.get_resource('shotmap')
+        if 'shotmap' not in data:
+            raise MatchDoesntHaveInfo(self.match_url)
+
+        match_shots = pd.DataFrame(data['shotmap'])
+        today = datetime.now().strftime('%Y-%m-%d')
+        if save_csv:
+            match_shots.to_csv(f'shots match - {self.match_id} - {today}.csv')
+        players = match_shots['player'].apply(pd.Series)
+        coordenates = match_shots['playerCoordinates'].apply(pd.Series)
+        match_shots = pd.concat([match_shots.drop(columns=['player']), players], axis=1)
+        match_shots = pd.concat([match_shots.drop(columns=['playerCoordinates']), coordenates], axis=1)
+        match_shots['match_id'] = self.match_id
+
+        event_data = self.event
+        home_name = (event_data.get('event') or {}).get('homeTeam', {}).get('name')
+        away_name = (event_data.get('event') or {}).get('awayTeam', {}).get('name')
+
+        if 'isHome' in match_shots.columns and home_name is not None:
+            match_shots['teamName'] = np.where(match_shots['isHome'], home_name, away_name)
+            match_shots['vs teamName'] = np.where(match_shots['isHome'], away_name, home_name)
+
+        sink = resolve_sink(sink)
+        if sink is not None:
+            tournament = (event_data.get('event') or {}).get('tournament', {}).get('uniqueTournament', {}).get('name')
+            season = (event_data.get('event') or {}).get('season', {}).get('year')
+            sink.write(match_shots, f'shotmap_{self.match_id}', 'Sofascore', tournament, season)
+
+        return match_shots
+
+    def get_players_match_stats(self):
+        home_name, away_name = self.get_team_names()
+        response = self.lineups
+
+        names = {'home': home_name, 'away': away_name}
+        dataframes = {}
+        for team in names.keys():
+            data = pd.DataFrame(response[team]['players'])
+            try:
+                columns_list = [
+                    data['player'].apply(pd.Series), data['shirtNumber'], 
+                    data['jerseyNumber'], data['position'], data['substitute'],
+                    data['statistics'].apply(pd.Series, dtype=object),
+                    data['captain']
+                ]
+            except KeyError:
+                raise MatchDoesntHaveInfo(self.match_url)
+            
+            df = pd.concat(columns_list, axis=1)
+            df['team'] = names[team]
+            dataframes[team] = df
+        
+        return dataframes['home'], dataframes['away']
+
+    def get_players_average_positions(self):
+        home_name, away_name = self.get_team_names()
+        response = self.get_resource('average-positions')
+        
+        names = {'home': home_name, 'away': away_name}
+        dataframes = {}
+        for team in names.keys():
+            data = pd.DataFrame(response[team])
+            df = pd.concat(
+                [data['player'].apply(pd.Series), data.drop(columns=['player'])],
+                axis=1
+            )
+            df['team'] = names[team]
+            dataframes[team] = df
+            
+        return dataframes['home'], dataframes['away']
+
+    def get_player_heatmap(self, player):
+        player_id = self.get_player_ids()[player]
+        data = self.get_resource(f'player/{player_id}/heatmap')
+        try:
+            heatmap = pd.DataFrame(data['heatmap'])
+        except KeyError:
+            raise MatchDoesntHaveInfo(self.match_url)
+        return heatmap
+
+    def get_player_match_events(self, player, events=None):
+        player_id = self.get_player_ids()[player]
+        data = self.get_resource(f'player/{player_id}/rating-breakdown')
+
+        if 'error' in data:
+            raise MatchDoesntHaveInfo(self.match_url)
+
+        if events is None:
+            categories = [k for k in ['passes', 'ball-carries', 'dribbles', 'defensive'] if k in data]
+        elif events == 'all':
+            categories = [k for k, v in data.items() if isinstance(v, list)]
+        else:
+            categories = [k for k in events if k in data]
+
+        if not categories:
+            return pd.DataFrame()
+
+        df_player_events = pd.concat(
+            [pd.json_normalize(data[k]).assign(category=k) for k in categories], 
+            ignore_index=True
+        )
+
+        df_player_events.rename(columns={
+            'playerCoordinates.x': 'x',
+            'playerCoordinates.y': 'y',
+            'passEndCoordinates.x': 'end_x',
+            'passEndCoordinates.y': 'end_y'
+        }, inplace=True)
+
+        cols = ['category'] + [c for c in df_player_events.columns if c != 'category']
+        df_player_events = df_player_events[cols]
+
+        return df_player_events
+
+
 class SofaScore:
     
-    def __init__(self):
+    def __init__(self, pool_size=1, cache=None, request_delay=(1, 3.5), fetch_mode='page'):
+        if pool_size < 1:
+            raise ValueError('pool_size must be at least 1')
+        if fetch_mode not in ['page', 'fetch']:
+            raise InvalidStat('fetch_mode', fetch_mode, ['page', 'fetch'])
+        self.fetch_mode = fetch_mode
+        self.pool_size = pool_size
+        self.cache = resolve_cache(cache)
+        # Minimum time between the start of two requests of the same browser of the pool.
+        self.scheduler = PolitenessScheduler(request_delay)
+        self._MAX_RETRIES = 2
+        # LIFO so sequential callers keep reusing the same warmed-up browser and
+        # extra browsers are only started when there is real concurrency.
+        self._slots = [_DriverSlot(i) for i in range(pool_size)]
+        self._free_slots = queue.LifoQueue()
+        for slot in reversed(self._slots):
+            self._free_slots.put(slot)
+        self.bulk_endpoints = {
+            'shotmap': 'get_match_shotmap',
+            'players_match_stats': 'get_players_match_stats',
+            'average_positions': 'get_players_average_positions',
+            'momentum': 'get_match_momentum',
+        }
         self.league_stats_fields = [
             'goals',
             'yellowCards',
@@ -149,14 +399,95 @@ class SofaScore:
             driver_executable_path=_get_system_chromedriver_path(),
         )
 
+    def _driver_is_alive(self, slot):
+        """Check that the driver of a slot still answers to the chromedriver session."""
+        if slot.driver is None:
+            return False
+        try:
+            slot.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _get_driver(self, slot):
+        """Return the driver of a slot, starting (or restarting) it if needed."""
+        if not self._driver_is_alive(slot):
+            self._reset_driver(slot)
+            slot.driver = self._build_driver()
+        return slot.driver
+
+    def _reset_driver(self, slot):
+        """Quit the driver of a slot, if any, so the next request starts a fresh one."""
+        if slot.driver is not None:
+            try:
+                slot.driver.quit()
+            except Exception:
+                pass
+            slot.driver = None
+        slot.warmed_up = False
+
+    @contextmanager
+    def _acquire_slot(self):
+        """Borrow a slot from the pool, blocking until one is free."""
+        slot = self._free_slots.get()
+        try:
+            yield slot
+        finally:
+            self._free_slots.put(slot)
+
+    def close(self):
+        """Close the browsers used for the requests and free their resources.
+
+        Usage:
+            sofascore = SofaScore()
+            # ... normal usage ...
+            sofascore.close()
+
+        It can also be used as a context manager:
+            with SofaScore() as sofascore:
+                ...
+        """
+        for slot in self._slots:
+            self._reset_driver(slot)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _fetch_with_driver(self, driver, path):
         url = f"{self.base_url}{path}"
         driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        data = json.loads(soup.text)
-        time.sleep(get_random_rate_sleep(1, 3.5))
-        return data
+        return self._wait_for_json(driver)
+
+    def _fetch_in_page(self, driver, path):
+        """Get the JSON with fetch() from inside the page, falling back to navigating to the url."""
+        url = f"{self.base_url}{path}"
+        driver.set_script_timeout(_PAGE_READY_TIMEOUT)
+        result = driver.execute_async_script(_IN_PAGE_FETCH_SCRIPT, url)
+        if isinstance(result, dict) and result.get('status'):
+            try:
+                return json.loads(result.get('body') or '')
+            except json.JSONDecodeError:
+                pass
+        return self._fetch_with_driver(driver, path)
+
+    def _wait_for_json(self, driver, timeout=_PAGE_READY_TIMEOUT):
+        """Poll the page until it finished loading and its body is valid JSON, instead of a fixed sleep."""
+        deadline = time.monotonic() + timeout
+        while True:
+            if driver.execute_script("return document.readyState") == "complete":
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+                try:
+                    return json.loads(soup.text)
+                except json.JSONDecodeError:
+                    if time.monotonic() >= deadline:
+                        raise
+            elif time.monotonic() >= deadline:
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+                return json.loads(soup.text)
+            time.sleep(_PAGE_READY_POLL_INTERVAL)
 
     def sofascore_request(self, path):
         """Request used to SofaScore
@@ -165,13 +496,106 @@ class SofaScore:
             path (str): Part of the url to make the request
 
         Returns:
-            data: _description_
+            data: JSON of the response as a dict.
         """
-        driver = self._build_driver()
-        try:
-            return self._fetch_with_driver(driver, path)
-        finally:
-            driver.quit()
+        if self.cache is None:
+            return self._pooled_request(path)
+        return self.cache.get_or_fetch(
+            f'{self.base_url}{path}',
+            lambda: self._pooled_request(path),
+            cacheable=json_cacheable,
+        )
+
+    def _pooled_request(self, path):
+        with self._acquire_slot() as slot:
+            for attempt in range(1, self._MAX_RETRIES + 1):
+                driver = self._get_driver(slot)
+                self.scheduler.wait(f'{PolitenessScheduler.host_key(self.base_url)}#{slot.index}')
+                try:
+                    if self.fetch_mode == 'fetch' and slot.warmed_up:
+                        return self._fetch_in_page(driver, path)
+                    data = self._fetch_with_driver(driver, path)
+                    # The browser is now on the SofaScore origin, so fetch() can be used from here.
+                    slot.warmed_up = True
+                    return data
+                except WebDriverException:
+                    # The browser crashed or the session was lost: start a new one and retry.
+                    self._reset_driver(slot)
+                    if attempt == self._MAX_RETRIES:
+                        raise
+
+    def fetch_many(self, paths):
+        """Request several SofaScore paths concurrently, using every browser of the pool.
+
+        Args:
+            paths (list): Parts of the urls to make the requests (same as sofascore_request).
+
+        Returns:
+            list: JSON of each response, in the same order as paths.
+        """
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, max(len(paths), 1))) as executor:
+            return list(executor.map(self.sofascore_request, paths))
+
+    def get_matches_bulk(self, match_urls, endpoints=('shotmap', 'players_match_stats', 'average_positions')):
+        """Run several match methods for many matches, spreading them over the pool of browsers.
+
+        Args:
+            match_urls (list): Full links to SofaScore matches
+            endpoints (list, optional): Keys of bulk_endpoints to get for each match.
+                Defaults to ('shotmap', 'players_match_stats', 'average_positions').
+
+        Raises:
+            InvalidStat: If an endpoint is not inside bulk_endpoints.
+
+        Returns:
+            list: A dict for each match (in the same order as match_urls) with the
+                result of each endpoint. Endpoints without info for that match are None.
+        """
+        endpoints = list(endpoints)
+        for endpoint in endpoints:
+            if endpoint not in self.bulk_endpoints:
+                raise InvalidStat('endpoints', endpoint, list(self.bulk_endpoints.keys()))
+
+        def _run(task):
+            match, endpoint = task
+            try:
+                return getattr(match, self.bulk_endpoints[endpoint])()
+            except MatchDoesntHaveInfo:
+                return None
+
+        # One SofaScoreMatch per url, so the endpoints of a match share its event/lineups.
+        match_urls = list(match_urls)
+        matches = [self.match(match_url) for match_url in match_urls]
+        tasks = [(match, endpoint) for match in matches for endpoint in endpoints]
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, max(len(tasks), 1))) as executor:
+            results = iter(executor.map(_run, tasks))
+        return [{endpoint: next(results) for endpoint in endpoints} for _ in matches]
+
+    def match(self, match_url):
+        """Get a SofaScoreMatch: every sub-resource of the match is requested only once
+        and shared by all its accessors (get_players_match_stats, get_player_heatmap, ...).
+
+        Args:
+            match_url (str): Full link to a SofaScore match
+
+        Returns:
+            SofaScoreMatch: Context object for that match.
+        """
+        return SofaScoreMatch(self, match_url)
+
+    def clear_match_cache(self, match_id):
+        """Remove the cached event and every sub-resource (shotmap, lineups, ...) of a match,
+        so the next requests get them fresh.
+
+        Args:
+            match_id (int): SofaScore id of the match.
+        """
+        if self.cache is None:
+            return
+        key = self.cache.make_key(f'{self.base_url}api/v1/event/{match_id}')
+        self.cache.delete(key)
+        self.cache.delete_prefix(f'{key}/')
 
     def get_match_data(self, match_url):
         """Gets all the general data from a match 
@@ -189,8 +613,6 @@ class SofaScore:
         
         data = self.sofascore_request(url)
         
-        time.sleep(get_random_rate_sleep(1.5, 2.5))
-        
         return data
 
     def get_match_momentum(self, match_url):
@@ -202,61 +624,22 @@ class SofaScore:
         Returns:
             DataFrame: Values needed to make a heatmap with pitch.kdeplot.
         """
-        
-        match_id = self.get_match_id(match_url)
-        
-        url = f'api/v1/event/{match_id}/graph'
-        data = self.sofascore_request(url)
+        return self.match(match_url).get_match_momentum()
 
-        try:
-            points = data['graphPoints']
-        except KeyError:
-            raise MatchDoesntHaveInfo(match_url)
-        
-        match_momentum = pd.DataFrame(points)
-        
-        return match_momentum
-
-    def get_match_shotmap(self, match_url, save_csv=False):
+    def get_match_shotmap(self, match_url, save_csv=False, sink=None):
         """Get a DataFrame with data of the shots of a match
 
         Args:
             match_url (str): Full link to a SofaScore match
             save_csv (bool, optional): Save the DataFrame to a csv. Defaults to False.
+            sink (str|OutputSink, optional): Also write the table with an OutputSink (a folder
+                means Parquet files in that folder). Defaults to None.
 
         Returns:
             DataFrame: Dataframe with all the data from the shotmap shown in SofaScore UI
         """
-        match_id = self.get_match_id(match_url)
+        return self.match(match_url).get_match_shotmap(save_csv, sink)
 
-        driver = self._build_driver()
-        try:
-            data = self._fetch_with_driver(driver, f'api/v1/event/{match_id}/shotmap')
-            if 'shotmap' not in data:
-                raise MatchDoesntHaveInfo(match_url)
-
-            match_shots = pd.DataFrame(data['shotmap'])
-            today = datetime.now().strftime('%Y-%m-%d')
-            if save_csv:
-                match_shots.to_csv(f'shots match - {match_id} - {today}.csv')
-            players = match_shots['player'].apply(pd.Series)
-            coordenates = match_shots['playerCoordinates'].apply(pd.Series)
-            match_shots = pd.concat([match_shots.drop(columns=['player']), players], axis=1)
-            match_shots = pd.concat([match_shots.drop(columns=['playerCoordinates']), coordenates], axis=1)
-            match_shots['match_id'] = match_id
-
-            event_data = self._fetch_with_driver(driver, f'api/v1/event/{match_id}')
-            home_name = (event_data.get('event') or {}).get('homeTeam', {}).get('name')
-            away_name = (event_data.get('event') or {}).get('awayTeam', {}).get('name')
-
-            if 'isHome' in match_shots.columns and home_name is not None:
-                match_shots['teamName'] = np.where(match_shots['isHome'], home_name, away_name)
-                match_shots['vs teamName'] = np.where(match_shots['isHome'], away_name, home_name)
-        finally:
-            driver.quit()
-
-        return match_shots
-    
     def get_positions(self, selected_positions):
         """Returns a string for the parameter filters of the scrape_league_stats() request.
 
@@ -275,49 +658,120 @@ class SofaScore:
         abbreviations = [positions[position] for position in selected_positions]
         return '~'.join(abbreviations)
     
-    def scrape_league_stats(self, league, season, save_csv=False, accumulation='total', selected_positions = ['Goalkeepers', 'Defenders', 'Midfielders', 'Forwards']):
+    def _league_stats_path(self, league_id, season_id, offset, accumulation, positions):
+        concatenated_fields = "%2C".join(self.league_stats_fields)
+        return f'api/v1' +\
+            f'/unique-tournament/{league_id}/season/{season_id}/statistics'+\
+            f'?limit=100&order=-rating&offset={offset}'+\
+            f'&accumulation={accumulation}' +\
+            f'&fields={concatenated_fields}'+\
+            f'&filters=position.in.{positions}'
+
+    def scrape_league_stats(self, league, season, save_csv=False, accumulation='total', selected_positions = ['Goalkeepers', 'Defenders', 'Midfielders', 'Forwards'], sink=None):
         """Get every player statistic that can be asked in league pages on SofaScore.
         Args:
             league (str): Possible leagues in get_available_leagues("Sofascore")
             season (str): Possible saeson in get_available_season_for_leagues("Sofascore", league)
-            accumulation (str, optional): Value of the filter accumulation. Can be "per90" and "perMatch". Defaults to 'total'.
+            accumulation (str|list, optional): Value of the filter accumulation. Can be "per90" and "perMatch". Defaults to 'total'.
+                A list (ex: ['total', 'per90']) gets every accumulation in one call.
             selected_positions (list, optional): Value of the filter positions. Defaults to ['Goalkeepers', 'Defenders', 'Midfielders', 'Forwards'].
+                A list of lists (ex: [['Goalkeepers'], ['Defenders', 'Midfielders']]) gets every filter in one call.
+            sink (str|OutputSink, optional): Also write the table with an OutputSink (a folder
+                means Parquet files in that folder). Defaults to None.
         Returns:
-            DataFrame: DataFrame with each row corresponding to a player and the columns are the fields defined on get_league_stats_fields()
+            DataFrame: DataFrame with each row corresponding to a player and the columns are the fields defined on get_league_stats_fields().
+                When more than one accumulation or position filter is asked, the columns accumulation and positions say where each row comes from.
         """
         
-        league_id = get_possible_leagues_for_page(league, season, 'Sofascore')[league]['id']
-        season_id = get_possible_leagues_for_page(league, season, 'Sofascore')[league]['seasons'][season]
-        positions = self.get_positions(selected_positions)
-        concatenated_fields = "%2C".join(self.league_stats_fields)
-        
-        offset = 0
-        df = pd.DataFrame()
-        for i in range(0,20):
-            request_url = f'api/v1' +\
-                f'/unique-tournament/{league_id}/season/{season_id}/statistics'+\
-                f'?limit=100&order=-rating&offset={offset}'+\
-                f'&accumulation={accumulation}' +\
-                f'&fields={concatenated_fields}'+\
-                f'&filters=position.in.{positions}'
-                
-            data = self.sofascore_request(request_url)
-            
-            new_df = pd.DataFrame(data['results'])
-            new_df['player'] = new_df.player.apply(pd.Series)['name']
-            new_df['team'] = new_df.team.apply(pd.Series)['name']
-            df = pd.concat([df, new_df])
-            
-            if data.get('page') == data.get('pages'):
-                print('End of the pages')
-                break
-            offset += 100
+        leagues = get_possible_leagues_for_page(league, season, 'Sofascore')
+        league_id = leagues[league]['id']
+        season_id = leagues[league]['seasons'][season]
+
+        accumulations = [accumulation] if isinstance(accumulation, str) else list(accumulation)
+        if all(isinstance(position, str) for position in selected_positions):
+            position_groups = [list(selected_positions)]
+        else:
+            position_groups = [list(group) for group in selected_positions]
+        combinations = [
+            (accumulation_value, self.get_positions(group))
+            for accumulation_value in accumulations
+            for group in position_groups
+        ]
+
+        # The first page of each combination tells how many pages there are, after
+        # that every remaining offset is known and they are requested concurrently.
+        first_pages = self.fetch_many([
+            self._league_stats_path(league_id, season_id, 0, accumulation_value, positions)
+            for accumulation_value, positions in combinations
+        ])
+        pending = []
+        for combination, data in zip(combinations, first_pages):
+            pages = min(data.get('pages') or 1, 20)
+            pending += [(combination, offset) for offset in range(100, pages * 100, 100)]
+        other_pages = self.fetch_many([
+            self._league_stats_path(league_id, season_id, offset, *combination)
+            for combination, offset in pending
+        ])
+
+        responses = {combination: [data] for combination, data in zip(combinations, first_pages)}
+        for (combination, _), data in zip(pending, other_pages):
+            responses[combination].append(data)
+        rows = []
+        for (accumulation_value, positions), pages_data in responses.items():
+            for data in pages_data:
+                for result in data['results']:
+                    rows.append({**result, 'accumulation': accumulation_value, 'positions': positions})
+
+        df = pd.DataFrame(rows)
+        if not df.empty:
+            df['player'] = df['player'].str.get('name')
+            df['team'] = df['team'].str.get('name')
+        if len(combinations) == 1:
+            df = df.drop(columns=['accumulation', 'positions'], errors='ignore')
             
         if save_csv:
             df.to_csv(f'{league} {season} stats.csv')
+        sink = resolve_sink(sink)
+        if sink is not None:
+            sink.write(df, 'league_stats', 'Sofascore', league, season)
         
         return df
     
+    def get_season_matches(self, league, season):
+        """Get the matches of a season that already started (finished and in play), newest first.
+
+        Args:
+            league (str): Possible leagues in get_available_leagues("Sofascore")
+            season (str): Possible saeson in get_available_season_for_leagues("Sofascore", league)
+
+        Returns:
+            DataFrame: One row per match with match_id, match_url, home, away, status
+                ('finished', 'inprogress', ...) and start_timestamp.
+        """
+        leagues = get_possible_leagues_for_page(league, season, 'Sofascore')
+        league_id = leagues[league]['id']
+        season_id = leagues[league]['seasons'][season]
+
+        events = []
+        page = 0
+        while True:
+            data = self.sofascore_request(f'api/v1/unique-tournament/{league_id}/season/{season_id}/events/last/{page}')
+            events += data.get('events', [])
+            if not data.get('hasNextPage'):
+                break
+            page += 1
+
+        rows = [{
+            'match_id': event['id'],
+            'match_url': f"{self.base_url}{event.get('slug', 'match')}/{event.get('customId', '')}#id:{event['id']}",
+            'home': (event.get('homeTeam') or {}).get('name'),
+            'away': (event.get('awayTeam') or {}).get('name'),
+            'status': (event.get('status') or {}).get('type'),
+            'start_timestamp': event.get('startTimestamp'),
+        } for event in events]
+        columns = ['match_id', 'match_url', 'home', 'away', 'status', 'start_timestamp']
+        return pd.DataFrame(rows, columns=columns).drop_duplicates('match_id')
+
     def get_players_match_stats(self, match_url):
         """Returns match data for each player.
 
@@ -329,34 +783,8 @@ class SofaScore:
                 a player and in each columns a different statistic or data of 
                 the player
         """
+        return self.match(match_url).get_players_match_stats()
 
-        match_id = self.get_match_id(match_url)
-        home_name, away_name = self.get_team_names(match_url)
-        
-        request_url = f'api/v1/event/{match_id}/lineups'
-        
-        response = self.sofascore_request(request_url)
-        
-        names = {'home': home_name, 'away': away_name}
-        dataframes = {}
-        for team in names.keys():
-            data = pd.DataFrame(response[team]['players'])
-            try:
-                columns_list = [
-                    data['player'].apply(pd.Series), data['shirtNumber'], 
-                    data['jerseyNumber'], data['position'], data['substitute'],
-                    data['statistics'].apply(pd.Series, dtype=object),
-                    data['captain']
-                ]
-            except KeyError:
-                raise MatchDoesntHaveInfo(match_url)
-            
-            df = pd.concat(columns_list, axis=1)
-            df['team'] = names[team]
-            dataframes[team] = df
-        
-        return dataframes['home'], dataframes['away']
-    
     def get_team_names(self, match_url):
         """Get the team names for the home and away teams
 
@@ -366,18 +794,8 @@ class SofaScore:
         Returns:
             strings: Name of home and away team.
         """
+        return self.match(match_url).get_team_names()
 
-        data = self.get_match_data(match_url)
-
-        try:
-            home_team = data['event']['homeTeam']['name']
-        except KeyError:
-            raise MatchDoesntHaveInfo(match_url)
-        
-        away_team = data['event']['awayTeam']['name']
-
-        return home_team, away_team
-    
     def get_players_average_positions(self, match_url):
         """Return player averages positions for each team
 
@@ -388,37 +806,12 @@ class SofaScore:
             list of DataFrames: Each row is a player and columns averageX and averageY 
                 denote their average position on the match.
         """
-        match_id = self.get_match_id(match_url)
-        home_name, away_name = self.get_team_names(match_url)
-
-        request_url = f'api/v1/event/{match_id}/average-positions'
+        return self.match(match_url).get_players_average_positions()
 
-        data = self.sofascore_request(request_url)
-        response = data
-        
-        names = {'home': home_name, 'away': away_name}
-        dataframes = {}
-        for team in names.keys():
-            data = pd.DataFrame(response[team])
-            df = pd.concat(
-                [data['player'].apply(pd.Series), data.drop(columns=['player'])],
-                axis=1
-            )
-            df['team'] = names[team]
-            dataframes[team] = df
-            
-        return dataframes['home'], dataframes['away']
-    
     ############################################################################
     
     def get_lineups(self, match_url):
-        match_id = self.get_match_id(match_url)
-
-        request_url = f'api/v1/event/{match_id}/lineups'
-        
-        data = self.sofascore_request(request_url)
-        
-        return data
+        return self.match(match_url).lineups
     
     def get_player_ids(self, match_url):
         """Get the player ids for a Sofascore match
@@ -431,19 +824,8 @@ class SofaScore:
                 Key: Name
                 Value: Id
         """
-        response = self.get_lineups(match_url)
-        
-        teams = ['home', 'away']
-        player_ids = {}
-        for team in teams:
-            data = response[team]['players']
+        return self.match(match_url).get_player_ids()
 
-            for item in data:
-                player_data = item['player']
-                player_ids[player_data['name']] = player_data['id']
-
-        return player_ids
-    
     def get_player_heatmap(self, match_url, player):
         """ Get the x-y coordinates to create a player heatmap. Use Seaborn's
         `kdeplot()` to create the heatmap image.
@@ -456,22 +838,8 @@ class SofaScore:
         Returns:
             DataFrame: Pandas dataframe with x-y coordinates for the player
         """
-        match_id = self.get_match_id(match_url)
-
-        player_ids = self.get_player_ids(match_url)
-        player_id = player_ids[player]
+        return self.match(match_url).get_player_heatmap(player)
 
-        request_url = f'api/v1/event/{match_id}/player/{player_id}/heatmap'
-        
-        data = self.sofascore_request(request_url)
-        
-        try:
-            heatmap = pd.DataFrame(data['heatmap'])
-        except KeyError:
-            raise MatchDoesntHaveInfo(match_url)
-        
-        return heatmap
-    
     def get_player_match_events(self, match_url, player, events=None):
         """ Get the x-y coordinates for a player events.
 
@@ -487,44 +855,7 @@ class SofaScore:
         Returns:
             DataFrame: Pandas dataframe with x-y coordinates for the player
         """
-        match_id = self.get_match_id(match_url)
-
-        player_ids = self.get_player_ids(match_url)
-        player_id = player_ids[player]
-
-        request_url = f'api/v1/event/{match_id}/player/{player_id}/rating-breakdown'
-        
-        data = self.sofascore_request(request_url)
-
-        if 'error' in data:
-            raise MatchDoesntHaveInfo(match_url)
-
-        if events is None:
-            categories = [k for k in ['passes', 'ball-carries', 'dribbles', 'defensive'] if k in data]
-        elif events == 'all':
-            categories = [k for k, v in data.items() if isinstance(v, list)]
-        else:
-            categories = [k for k in events if k in data]
-
-        if not categories:
-            return pd.DataFrame()
-
-        df_player_events = pd.concat(
-            [pd.json_normalize(data[k]).assign(category=k) for k in categories], 
-            ignore_index=True
-        )
-
-        df_player_events.rename(columns={
-            'playerCoordinates.x': 'x',
-            'playerCoordinates.y': 'y',
-            'passEndCoordinates.x': 'end_x',
-            'passEndCoordinates.y': 'end_y'
-        }, inplace=True)
-
-        cols = ['category'] + [c for c in df_player_events.columns if c != 'category']
-        df_player_events = df_player_events[cols]
-
-        return df_player_events
+        return self.match(match_url).get_player_match_events(player, events)
 
     def get_player_season_heatmap(self, league, season, player_id):
         """Get a player season heatmap as shown in the player page in SofaScore UI
@@ -538,8 +869,9 @@ class SofaScore:
             _type_: _description_
         """
         
-        league_id = get_possible_leagues_for_page(league, season, 'Sofascore')[league]['id']
-        season_id = get_possible_leagues_for_page(league, season, 'Sofascore')[league]['seasons'][season]
+        league_data = get_possible_leagues_for_page(league, season, 'Sofascore')[league]
+        league_id = league_data['id']
+        season_id = league_data['seasons'][season]
         request_url = f'api/v1/player/{player_id}/unique-tournament/{league_id}/season/{season_id}/heatmap/overall'
         
         data = self.sofascore_request(request_url)
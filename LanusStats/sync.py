@@ -0,0 +1,213 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from .exceptions import InvalidStat, MatchDoesntHaveInfo
+
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.expanduser('~'), '.local', 'share', 'lanusstats', 'manifest.sqlite')
+
+# Status of a (match, endpoint) in the manifest
+OK = 'ok'
+NO_INFO = 'no_info'  # The scraper raised MatchDoesntHaveInfo
+ERROR = 'error'
+
+# SofaScore statuses of matches that will not change anymore, and of matches without data yet
+FINISHED_STATUSES = {'finished', 'canceled', 'abandoned'}
+NOT_STARTED_STATUSES = {'notstarted', 'postponed'}
+
+
+class SyncManifest:
+    """SQLite record of what was already fetched: one row per source, match and endpoint
+    with its status, if the match was over at that moment, when it was fetched and how
+    many times it was tried.
+
+    Args:
+        path (str, optional): SQLite file. Defaults to ~/.local/share/lanusstats/manifest.sqlite.
+    """
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS manifest ('
+            'source TEXT NOT NULL, match_id TEXT NOT NULL, endpoint TEXT NOT NULL, '
+            'status TEXT NOT NULL, finished INTEGER NOT NULL, fetched_at REAL NOT NULL, '
+            'attempts INTEGER NOT NULL, error TEXT, PRIMARY KEY (source, match_id, endpoint))'
+        )
+        self._db.commit()
+
+    def get(self, source, match_id, endpoint):
+        """Entry of a match endpoint as a dict, or None if it was never fetched."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT status, finished, fetched_at, attempts, error FROM manifest '
+                'WHERE source = ? AND match_id = ? AND endpoint = ?',
+                (source, str(match_id), endpoint),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(['status', 'finished', 'fetched_at', 'attempts', 'error'], row))
+
+    def record(self, source, match_id, endpoint, status, finished, error=None):
+        """Save the outcome of a fetch. It is committed at once, so an interrupted sync keeps it."""
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT INTO manifest (source, match_id, endpoint, status, finished, fetched_at, attempts, error) '
+                'VALUES (?, ?, ?, ?, ?, ?, 1, ?) '
+                'ON CONFLICT (source, match_id, endpoint) DO UPDATE SET status = excluded.status, '
+                'finished = excluded.finished, fetched_at = excluded.fetched_at, '
+                'attempts = manifest.attempts + 1, error = excluded.error',
+                (source, str(match_id), endpoint, status, int(bool(finished)), time.time(), error),
+            )
+
+    def is_done(self, source, match_id, endpoint):
+        """True if the endpoint was fetched (or had no info) when the match was already over."""
+        entry = self.get(source, match_id, endpoint)
+        return entry is not None and entry['status'] != ERROR and bool(entry['finished'])
+
+    def entries(self, source=None):
+        """Every entry of the manifest (or of a source) as a DataFrame."""
+        sql = 'SELECT * FROM manifest' + (' WHERE source = ?' if source else '')
+        with self._lock:
+            return pd.read_sql_query(sql, self._db, params=[source] if source else None)
+
+    def forget(self, source, match_id=None):
+        """Remove the entries of a source (or of one of its matches) so they are fetched again."""
+        with self._lock, self._db:
+            if match_id is None:
+                self._db.execute('DELETE FROM manifest WHERE source = ?', (source,))
+            else:
+                self._db.execute('DELETE FROM manifest WHERE source = ? AND match_id = ?', (source, str(match_id)))
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class SeasonSync:
+    """Keeps the matches of a SofaScore season up to date fetching only what is missing.
+
+    Each run lists the matches that already started and fetches the endpoints of the ones
+    that are not in the manifest, that were still in play the last time or that failed.
+    Every outcome (including MatchDoesntHaveInfo) is saved as soon as it arrives, so an
+    interrupted run goes on where it stopped and a daily run only costs the new matches.
+
+    Usage:
+        warehouse = Warehouse()
+        sync = SeasonSync(SofaScore(pool_size=3), warehouse=warehouse)
+        sync.run('Argentina Liga Profesional', '2026')
+
+    Args:
+        sofascore (SofaScore): Scraper used to list and fetch the matches.
+        endpoints (list, optional): Keys of SofaScore.bulk_endpoints to fetch for every match.
+            Defaults to ('shotmap', 'players_match_stats').
+        manifest (str|SyncManifest, optional): Manifest or path of its SQLite file. Defaults to
+            None (DEFAULT_MANIFEST_PATH).
+        warehouse (Warehouse, optional): Store the shotmaps and player stats there. Defaults to None.
+        on_result (callable, optional): Called as on_result(match_id, endpoint, result) with the
+            result of every fetched endpoint. Defaults to None.
+    """
+
+    source = 'Sofascore'
+
+    def __init__(self, sofascore, endpoints=('shotmap', 'players_match_stats'), manifest=None, warehouse=None, on_result=None):
+        for endpoint in endpoints:
+            if endpoint not in sofascore.bulk_endpoints:
+                raise InvalidStat('endpoints', endpoint, list(sofascore.bulk_endpoints.keys()))
+        self.sofascore = sofascore
+        self.endpoints = list(endpoints)
+        if manifest is None or isinstance(manifest, (str, os.PathLike)):
+            manifest = SyncManifest(os.fspath(manifest or DEFAULT_MANIFEST_PATH))
+        self.manifest = manifest
+        self.warehouse = warehouse
+        self.on_result = on_result
+
+    def plan(self, matches):
+        """(match row, endpoint) pairs that have to be fetched.
+
+        Args:
+            matches (DataFrame): Matches as SofaScore.get_season_matches returns them.
+
+        Returns:
+            list: Pairs to fetch, oldest matches first.
+        """
+        tasks = []
+        for match in matches.sort_values('start_timestamp').itertuples(index=False):
+            if match.status in NOT_STARTED_STATUSES:
+                continue
+            for endpoint in self.endpoints:
+                if not self.manifest.is_done(self.source, match.match_id, endpoint):
+                    tasks.append((match, endpoint))
+        return tasks
+
+    def run(self, league, season):
+        """Fetch what is missing of a season.
+
+        Args:
+            league (str): Possible leagues in get_available_leagues("Sofascore")
+            season (str): Possible saeson in get_available_season_for_leagues("Sofascore", league)
+
+        Returns:
+            DataFrame: One row per fetched match endpoint with match_id, endpoint, status and error,
+                so its length is the number of endpoints that were missing. attrs['matches'] has
+                the number of matches of the season.
+        """
+        matches = self.sofascore.get_season_matches(league, season)
+        tasks = self.plan(matches)
+
+        # One SofaScoreMatch per match, so its endpoints share the event and lineups.
+        # Matches that were in play last time drop what the cache kept from then.
+        contexts = {}
+        cleared = set()
+        for match, endpoint in tasks:
+            entry = self.manifest.get(self.source, match.match_id, endpoint)
+            if entry is not None and not entry['finished'] and match.match_id not in cleared:
+                self.sofascore.clear_match_cache(match.match_id)
+                cleared.add(match.match_id)
+            if match.match_id not in contexts:
+                contexts[match.match_id] = self.sofascore.match(match.match_url)
+
+        report = []
+        with ThreadPoolExecutor(max_workers=min(self.sofascore.pool_size, max(len(tasks), 1))) as executor:
+            futures = {
+                executor.submit(self._fetch, contexts[match.match_id], endpoint): (match, endpoint)
+                for match, endpoint in tasks
+            }
+            for future in as_completed(futures):
+                match, endpoint = futures[future]
+                status, result, error = future.result()
+                if status == OK:
+                    try:
+                        self._store(match.match_id, endpoint, result)
+                    except Exception as exception:
+                        status, error = ERROR, repr(exception)
+                finished = match.status in FINISHED_STATUSES
+                self.manifest.record(self.source, match.match_id, endpoint, status, finished, error)
+                report.append({'match_id': match.match_id, 'endpoint': endpoint, 'status': status, 'error': error})
+        report = pd.DataFrame(report, columns=['match_id', 'endpoint', 'status', 'error'])
+        report.attrs['matches'] = len(matches)
+        return report
+
+    def _fetch(self, match, endpoint):
+        try:
+            return OK, getattr(match, self.sofascore.bulk_endpoints[endpoint])(), None
+        except MatchDoesntHaveInfo:
+            return NO_INFO, None, None
+        except Exception as exception:
+            return ERROR, None, repr(exception)
+
+    def _store(self, match_id, endpoint, result):
+        if self.warehouse is not None:
+            if endpoint == 'shotmap':
+                self.warehouse.store_sofascore_shotmap(result)
+            elif endpoint == 'players_match_stats':
+                self.warehouse.store_sofascore_players_match_stats(match_id, *result)
+        if self.on_result is not None:
+            self.on_result(match_id, endpoint, result)
@@ -1,17 +1,75 @@
 import pandas as pd
 import requests
 import json
-from PIL import Image
 import re
 from io import BytesIO
 from .functions import get_possible_leagues_for_page
 from .exceptions import MatchDoesntHaveInfo
 from .config import headers
+from .cache import resolve_cache, json_cacheable, CoalescingLRU, NEVER_EXPIRES, ONE_MINUTE, _match_finished, _match_status_ttl
 import time
 import numpy as np
 
+
+class _ThreeSixFiveScoresResponse:
+    """
+    Thin wrapper around a parsed dict that exposes a .json() method, so the
+    responses served from the cache behave like the ones from requests.
+    """
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
 class ThreeSixFiveScores:
 
+    # Games asked in one request to web/game/stats/. The API doesn't document a limit,
+    # so it is kept low enough for the URL and the response to stay small.
+    games_per_stats_request = 10
+    # Keys of the single game stats response that a split batched response must have for
+    # each game, otherwise the game is requested alone.
+    game_stats_keys = ('statistics', 'competitors', 'actualGameStatistics')
+
+    def __init__(self, cache=None, match_data_cache_size=32):
+        self.cache = resolve_cache(cache)
+        # Parsed game and game stats payloads by game id, shared by every accessor of a
+        # match. Concurrent calls for the same game wait for the request already running.
+        # Games still in play expire after a minute, finished ones stay until evicted.
+        self._games = CoalescingLRU(match_data_cache_size, ttl=lambda game: _match_status_ttl({'game': game}))
+        self._games_stats = CoalescingLRU(match_data_cache_size)
+
+    def threesixfivescores_request(self, url):
+        """Request used to the 365Scores API.
+
+        Args:
+            url (str): Full URL of the request.
+
+        Returns:
+            dict: JSON of the response.
+        """
+        if self.cache is None:
+            return self._request(url)
+        return self.cache.get_or_fetch(url, lambda: self._request(url), cacheable=json_cacheable)
+
+    def _request(self, url):
+        response = requests.get(url, headers=headers)
+        time.sleep(3)
+        response.raise_for_status()
+        return response.json()
+
+    def _request_content(self, url):
+        if self.cache is None:
+            return self._download(url)
+        return self.cache.get_or_fetch(url, lambda: self._download(url), namespace='content')
+
+    def _download(self, url):
+        response = requests.get(url, headers=headers)
+        time.sleep(3)
+        response.raise_for_status()
+        return response.content
+
     def parse_dataframe(self, objeto):
         df = pd.DataFrame(objeto['rows'])
         df_1 = df['entity'].apply(pd.Series)
@@ -32,9 +90,7 @@ class ThreeSixFiveScores:
         """
         leagues = get_possible_leagues_for_page(league, None, '365Scores')
         league_id = leagues[league]['id']
-        response = requests.get(f'https://webws.365scores.com/web/stats/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&competitions={league_id}&competitors=&withSeasons=true', headers=headers)
-        time.sleep(3)
-        stats = response.json()
+        stats = self.threesixfivescores_request(f'https://webws.365scores.com/web/stats/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&competitions={league_id}&competitors=&withSeasons=true')
         general_stats = stats['stats']
         total_df = pd.DataFrame()
         for i in range(len(general_stats)):
@@ -67,13 +123,13 @@ class ThreeSixFiveScores:
             match_url (url): 365Scores match URL. Example: https://www.365scores.com/es-mx/football/match/copa-de-la-liga-profesional-7214/lanus-union-santa-fe-869-7206-7214#id=4033824
 
         Returns:
-            match_data: Json with game data.
+            match_data: Json with game data. It is requested once per game and shared by the
+                other methods of the match, treat it as read-only.
         """
         
         matchup_id, game_id = self.get_ids(match_url)
-        response = requests.get(f'https://webws.365scores.com/web/game/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&gameId={game_id}&matchupId={matchup_id}&topBookmaker=14', headers=headers)
-        time.sleep(3)
-        match_data = response.json()['game']
+        url = f'https://webws.365scores.com/web/game/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&gameId={game_id}&matchupId={matchup_id}&topBookmaker=14'
+        match_data = self._games.get_or_compute(game_id or url, lambda: self.threesixfivescores_request(url)['game'])
         return match_data
     
     def get_requests_stats(self, match_url):
@@ -86,10 +142,129 @@ class ThreeSixFiveScores:
             response: JSON with the response of the request.
         """
         matchup_id, game_id = self.get_ids(match_url)
-        response = requests.get(f'https://webws.365scores.com/web/game/stats/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&games={game_id}', headers=headers)
-        time.sleep(3)
-        return response
+        url = f'https://webws.365scores.com/web/game/stats/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&games={game_id}'
+        data = self._games_stats.get_or_compute(game_id or url, lambda: self.threesixfivescores_request(url), ttl=self._game_stats_ttl(game_id))
+        return _ThreeSixFiveScoresResponse(data)
     
+    def request_games_stats(self, match_urls, chunk_size=None):
+        """Request the stats of several matches putting many game ids in each request.
+
+        The stats are split back per game and kept with the ones of get_requests_stats, so
+        get_match_general_stats and get_match_time_stats of those matches don't request them again.
+        Games already requested are skipped. If a response can't be split (a team playing two of
+        the games of a request and the rows without game id) or misses part of what a single game
+        request returns (like actualGameStatistics), the games of that request are requested one by one.
+
+        Args:
+            match_urls (list): 365Scores match URLs.
+            chunk_size (int, optional): Games per request. Defaults to None (games_per_stats_request).
+
+        Returns:
+            list: JSON of the stats of each match, in the same order as match_urls.
+        """
+        chunk_size = chunk_size or self.games_per_stats_request
+        game_ids = [self.get_ids(match_url)[1] for match_url in match_urls]
+        missing = [game_id for game_id in dict.fromkeys(game_ids) if game_id is not None and game_id not in self._games_stats]
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            if len(chunk) == 1:
+                continue
+            data = self.threesixfivescores_request(f'https://webws.365scores.com/web/game/stats/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&games={",".join(chunk)}')
+            games_stats = self._split_games_stats(data, chunk)
+            if games_stats is None:
+                continue
+            for game_id, game_stats in games_stats.items():
+                self._games_stats.put(game_id, game_stats, ttl=self._game_stats_ttl(game_id))
+        return [self.get_requests_stats(match_url).json() for match_url in match_urls]
+
+    def _split_games_stats(self, data, game_ids):
+        """Split a multi game stats response in one dict per game with the same keys as the
+        single game response, or None if some row can't be assigned to a game or some game
+        lacks one of game_stats_keys."""
+        # Cada fila trae competitorId y a veces gameId; el equipo alcanza mientras no juegue
+        # dos de los partidos pedidos.
+        competitor_games = {}
+        for game in data.get('games', []):
+            for side in ['homeCompetitor', 'awayCompetitor']:
+                competitor_id = (game.get(side) or {}).get('id')
+                if competitor_id is None:
+                    continue
+                if competitor_games.setdefault(competitor_id, str(game['id'])) != str(game['id']):
+                    competitor_games[competitor_id] = None
+
+        def game_of(row):
+            if row.get('gameId') is not None:
+                return str(row['gameId'])
+            return competitor_games.get(row.get('competitorId'))
+
+        games_stats = {game_id: {'statistics': [], 'competitors': []} for game_id in game_ids}
+        for key in ['statistics', 'competitors']:
+            for row in data.get(key, []):
+                game_id = game_of(row) if key == 'statistics' else game_of({'gameId': row.get('gameId'), 'competitorId': row.get('id')})
+                if game_id not in games_stats:
+                    return None
+                games_stats[game_id][key].append(row)
+
+        actual_game_statistics = data.get('actualGameStatistics')
+        if actual_game_statistics is not None:
+            if not isinstance(actual_game_statistics, list):
+                return None
+            for row in actual_game_statistics:
+                if str(row.get('gameId')) not in games_stats:
+                    return None
+                games_stats[str(row['gameId'])]['actualGameStatistics'] = row
+
+        for game_stats in games_stats.values():
+            if len(game_stats['competitors']) != 2 or any(key not in game_stats for key in self.game_stats_keys):
+                return None
+        return games_stats
+
+    def get_matches_general_stats(self, match_urls, chunk_size=None):
+        """Get the general stats of several matches with as few requests as possible.
+
+        Args:
+            match_urls (list): 365Scores match URLs.
+            chunk_size (int, optional): Games per request. Defaults to None (games_per_stats_request).
+
+        Returns:
+            list: DataFrame like get_match_general_stats for each match, in the same order as match_urls.
+        """
+        return [self._general_stats_frame(data) for data in self.request_games_stats(match_urls, chunk_size)]
+
+    def get_matches_time_stats(self, match_urls, chunk_size=None):
+        """Get the time stats of several matches with as few requests as possible.
+
+        Args:
+            match_urls (list): 365Scores match URLs.
+            chunk_size (int, optional): Games per request. Defaults to None (games_per_stats_request).
+
+        Returns:
+            list: JSON like get_match_time_stats for each match (None if the match doesn't have
+                them), in the same order as match_urls.
+        """
+        return [data.get('actualGameStatistics') for data in self.request_games_stats(match_urls, chunk_size)]
+
+    def _game_stats_ttl(self, game_id):
+        # Las stats no dicen si el partido terminó: se guardan como el partido si ya
+        # se lo vio terminado y solo un minuto si no.
+        def ttl(data):
+            return NEVER_EXPIRES if _match_finished({'game': self._games.get(game_id)}) else ONE_MINUTE
+        return ttl
+
+    def clear_match_data(self, match_url=None):
+        """Forget the game and stats payloads kept in memory, so the next call requests them again.
+
+        Args:
+            match_url (str, optional): 365Scores match URL to forget. Defaults to None (every match).
+        """
+        if match_url is None:
+            self._games.clear()
+            self._games_stats.clear()
+            return
+        game_id = self.get_ids(match_url)[1]
+        self._games.invalidate(game_id)
+        self._games_stats.invalidate(game_id)
+
     def get_match_general_stats(self, match_url):
         """Get data from a match and scrape it. Requests about general stats.
 
@@ -101,16 +276,19 @@ class ThreeSixFiveScores:
         """
         
         response = self.get_requests_stats(match_url)
-        match_stats = pd.DataFrame(response.json()['statistics'])
+        return self._general_stats_frame(response.json())
+
+    def _general_stats_frame(self, data):
+        match_stats = pd.DataFrame(data['statistics'])
         
         team1 = {
-            'id': response.json()['competitors'][0]['id'],
-            'name': response.json()['competitors'][0]['name']
+            'id': data['competitors'][0]['id'],
+            'name': data['competitors'][0]['name']
         }
         
         team2 = {
-            'id': response.json()['competitors'][1]['id'],
-            'name': response.json()['competitors'][1]['name']
+            'id': data['competitors'][1]['id'],
+            'name': data['competitors'][1]['name']
         }
         
         match_stats['team_name'] = np.where(match_stats['competitorId'] == team1['id'], team1['name'], team2['name'])
@@ -222,15 +400,16 @@ class ThreeSixFiveScores:
         Returns:
             heatmap_image: Image of the
         """
+        from PIL import Image  # only needed here, keeps PIL out of the package import
+
         match_data = self.get_match_data(match_url)
         players = match_data['homeCompetitor']['lineups']['members']
         df_players = pd.DataFrame(players)
         players_total = pd.DataFrame(match_data['members'])
         df_players = df_players.merge(players_total, on='id', how='left')
         try:
-            heatmap = requests.get(df_players[df_players['name'] == player].heatMap.iloc[0], headers=headers)
-            time.sleep(3)
+            heatmap_url = df_players[df_players['name'] == player].heatMap.iloc[0]
         except AttributeError:
             raise MatchDoesntHaveInfo(match_url)
-        heatmap_image = Image.open(BytesIO(heatmap.content))
+        heatmap_image = Image.open(BytesIO(self._request_content(heatmap_url)))
         return heatmap_image
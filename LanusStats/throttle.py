@@ -0,0 +1,50 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class PolitenessScheduler:
+    """Keeps a minimum interval between the starts of consecutive requests with the same key
+    (usually the host). It only delays a request when it would otherwise start too soon, so
+    time spent waiting on the network or parsing already counts towards the interval.
+
+    Usage:
+        scheduler = PolitenessScheduler(min_interval=(1, 3.5))
+        scheduler.wait(PolitenessScheduler.host_key(url))
+        # ... make the request ...
+
+    Args:
+        min_interval (float|tuple, optional): Seconds between requests. A (min, max) tuple
+            picks a random interval each time. Defaults to (1, 3.5).
+    """
+
+    def __init__(self, min_interval=(1, 3.5)):
+        self.min_interval = min_interval
+        self._next_allowed = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(url):
+        return urlsplit(url).netloc.lower()
+
+    def _interval(self):
+        if isinstance(self.min_interval, (tuple, list)):
+            return random.uniform(*self.min_interval)
+        return self.min_interval
+
+    def reserve(self, key):
+        """Book the next slot for a key and return how many seconds to wait before using it.
+        Useful from async code: await asyncio.sleep(scheduler.reserve(key)).
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(key, now))
+            self._next_allowed[key] = start + self._interval()
+            return start - now
+
+    def wait(self, key):
+        """Block until a request with this key is allowed to start."""
+        delay = self.reserve(key)
+        if delay > 0:
+            time.sleep(delay)
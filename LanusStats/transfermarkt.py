@@ -1,23 +1,41 @@
 import requests
+import json
 from bs4 import BeautifulSoup
 import pandas as pd
 import numpy as np
 import time
 from .config import headers as request_headers
-from .functions import get_possible_leagues
+from .functions import get_possible_leagues_for_page
+from .cache import resolve_cache
+from .parsers import get_parser
 from .exceptions import PlayerDoesntHaveInfo
 
 
 class Transfermarkt:
     
-    def __init__(self):
+    def __init__(self, cache=None, parser='bs4'):
         self.page = "Transfermarkt"
+        self.cache = resolve_cache(cache)
+        self.parser = get_parser(parser)
     
-    def transfermarkt_request_to_soup(self, url):
+    def transfermarkt_request(self, url, delay=3):
+        if self.cache is None:
+            return self._download(url, delay)
+        return self.cache.get_or_fetch(url, lambda: self._download(url, delay), namespace='content')
+
+    def _download(self, url, delay):
         response = requests.get(url, headers=request_headers)
-        time.sleep(3)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        time.sleep(delay)
+        response.raise_for_status()
+        return response.content
+
+    def transfermarkt_request_to_soup(self, url):
+        content = self.transfermarkt_request(url)
+        soup = BeautifulSoup(content, 'html.parser')
         return soup
+
+    def transfermarkt_request_json(self, url):
+        return json.loads(self.transfermarkt_request(url))
     
     def get_items_table(self, soup):
         table = soup.find('table', {'class': 'items'})
@@ -30,19 +48,14 @@ class Transfermarkt:
     def get_head_coach_historical_data(self, name, headcoach_id):
         modified_name = self.parse_name(name)
         url = f'https://www.transfermarkt.com.ar/{modified_name}/stationen/trainer/{headcoach_id}/plus/1'
-        soup = self.transfermarkt_request_to_soup(url)
-        table = self.get_items_table(soup)
-        
-        try:
-            headers = [header.get_text() for header in table.find_all('th')]
-        except AttributeError:
+        document = self.parser.parse(self.transfermarkt_request(url))
+        tables = self.parser.tables_with_class(document, 'items')
+        if not tables:
             raise(PlayerDoesntHaveInfo(url))
+        table = tables[0]
 
-        rows = []
-        for row in table.find('tbody').find_all('tr'):
-            cells = row.find_all('td')
-            cells = [cell.get_text(strip=True) if cell.find('img') is None else cell.find('img')['src'] for cell in cells]
-            rows.append(cells)
+        headers = self.parser.header_cells(table)
+        rows = self.parser.rows(table, strip_pieces=True, images=True)
             
         df = pd.DataFrame(rows, columns=headers).drop(columns=['wappen'])
         return df
@@ -122,8 +135,9 @@ class Transfermarkt:
     
     def get_league_teams_valuations(self, league, season):
         season_id = self.get_season_id(season)
-        slug_league = get_possible_leagues(league, None, self.page)["Transfermarkt"][league]['slug']
-        id_league = get_possible_leagues(league, None, self.page)["Transfermarkt"][league]['id']
+        league_data = get_possible_leagues_for_page(league, None, self.page)[league]
+        slug_league = league_data['slug']
+        id_league = league_data['id']
         league_url = f'https://www.transfermarkt.com/{slug_league}/startseite/wettbewerb/{id_league}'
         league_url = league_url + '/plus/?saison_id=' + f'{season_id}'
 
@@ -143,9 +157,8 @@ class Transfermarkt:
         return df_total
 
     def get_player_transfer_history(self, player_id):
-        response = requests.get(f'https://www.transfermarkt.com.ar/ceapi/transferHistory/list/{player_id}', headers=request_headers)
-        time.sleep(3)
-        transfer_df = pd.DataFrame(response.json()['transfers'])
+        response = self.transfermarkt_request_json(f'https://www.transfermarkt.com.ar/ceapi/transferHistory/list/{player_id}')
+        transfer_df = pd.DataFrame(response['transfers'])
         df_from = transfer_df['from'].apply(pd.Series).rename(columns={'clubName': 'club_from'})['club_from']
         df_to = transfer_df['to'].apply(pd.Series).rename(columns={'clubName': 'club_to'})['club_to']
         final_df = pd.concat([transfer_df, df_from, df_to], axis=1)
@@ -171,8 +184,8 @@ class Transfermarkt:
         return df
     
     def get_last_page(self, url):
-        data = requests.get(f'{url}/1', headers=request_headers)
-        soup = BeautifulSoup(data.content, 'html.parser')
+        data = self.transfermarkt_request(f'{url}/1', delay=0)
+        soup = BeautifulSoup(data, 'html.parser')
         pager_div = soup.find('div', class_='pager')
         try:
             last_page_li = pager_div.find('li', class_='tm-pagination__list-item tm-pagination__list-item--icon-last-page')
@@ -250,11 +263,10 @@ class Transfermarkt:
         return df
     
     def get_player_market_value(self, player_id):
-        response = requests.get(f'https://www.transfermarkt.com.ar/ceapi/marketValueDevelopment/graph/{player_id}', headers=request_headers)
-        time.sleep(3)
-        values = pd.DataFrame(response.json()['list'])
+        response = self.transfermarkt_request_json(f'https://www.transfermarkt.com.ar/ceapi/marketValueDevelopment/graph/{player_id}')
+        values = pd.DataFrame(response['list'])
         values['wappen'] = values['wappen'].apply(lambda x: np.NAN if x == '' else x).ffill()
-        player_name = response.json()['details_url'].split('/')[1].replace('-', ' ').title()
+        player_name = response['details_url'].split('/')[1].replace('-', ' ').title()
         values['player'] = player_name
         return values
         
@@ -3,6 +3,7 @@ import pandas as pd
 import urllib
 import numpy as np
 import os
+import threading
 from mplsoccer import PyPizza, add_image, VerticalPitch, Pitch
 from PIL import Image
 from urllib.request import urlopen
@@ -17,7 +18,31 @@ from .functions import semicircle
 from .config import soc_cm
 from .threesixfivescores import ThreeSixFiveScores
 from .transfermarkt import Transfermarkt
-fotmob, threesixfivescores, transfermarkt, sofascore = FotMob(), ThreeSixFiveScores(), Transfermarkt(), SofaScore()
+
+# Scrapers shared by the plots. They are created the first time a plot needs them,
+# so importing this module does not start browsers or event loop threads.
+_CLIENT_CLASSES = {
+    'fotmob': FotMob,
+    'threesixfivescores': ThreeSixFiveScores,
+    'transfermarkt': Transfermarkt,
+    'sofascore': SofaScore,
+}
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(name):
+    with _clients_lock:
+        if name not in _clients:
+            _clients[name] = _CLIENT_CLASSES[name]()
+        return _clients[name]
+
+
+def __getattr__(name):
+    # Keeps visualizations.fotmob, visualizations.sofascore, etc. working
+    if name in _CLIENT_CLASSES:
+        return _get_client(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Obtener la ruta del directorio actual del módulo
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -186,8 +211,8 @@ def fotmob_match_momentum_plot(match_id, save_fig=False):
     Returns:
         fig, ax: A png and the fig and axes for further customization
     """
-    response = fotmob.request_match_details(match_id)
-    home_color, away_color = fotmob.get_team_colors(match_id)
+    response = _get_client('fotmob').request_match_details(match_id)
+    home_color, away_color = _get_client('fotmob').get_team_colors(match_id)
         
     try:
         match_momentum_df = pd.DataFrame(response.json()['content']['matchFacts']['momentum']['main']['data'])
@@ -227,7 +252,7 @@ def fotmob_hexbin_shotmap(season_index, competition_index, player_id, credit_ext
         credit_extra (str, optional): If you want to add your name or handle. Defaults to ' '.
         save_fig (bool, optional): Saves the image to a png. Defaults to False.
     """
-    df = fotmob.get_player_shotmap(season_index, competition_index, player_id)
+    df = _get_client('fotmob').get_player_shotmap(season_index, competition_index, player_id)
     
     df = df[df['situation'] != 'Penalty']
     
@@ -376,6 +401,8 @@ def threesixfivescores_match_shotmap(match_url, save_fig=False):
         save_fig (bool, optional): Saves the image to a png. Defaults to False.
     """
     
+    threesixfivescores = _get_client('threesixfivescores')
+    # Both read the same game payload, which the client requests only once
     shotmap = threesixfivescores.get_match_shotmap(match_url)
     home_data, away_data = threesixfivescores.get_team_data(match_url)
     
@@ -422,7 +449,7 @@ def threesixfivescores_match_shotmap(match_url, save_fig=False):
         plt.savefig(f'Mapa de tiros de {local} vs. {visit}', bbox_inches='tight', dpi=300)
     
 def transfermarkt_player_market_value(transfermarkt_player_id, save_fig=False, plot_age=False):
-    values = transfermarkt.get_player_market_value(transfermarkt_player_id)
+    values = _get_client('transfermarkt').get_player_market_value(transfermarkt_player_id)
     values['y'] = values['y'] / 1000000
     x = pd.to_datetime(values.datum_mw, format='%d/%m/%Y')
     y = values.y
@@ -454,7 +481,7 @@ def transfermarkt_player_market_value(transfermarkt_player_id, save_fig=False, p
         plt.savefig(f'{player_name} market value.png', bbox_inches='tight', dpi=300)
 
 def sofascore_plot_match_events(match_url, player, events=None, dashboard=False, save_fig=False):
-    df_events = sofascore.get_player_match_events(match_url, player, events=events)
+    df_events = _get_client('sofascore').get_player_match_events(match_url, player, events=events)
     trad_event = {
                 'passes': "Pases",
                 'ball-carries': 'Carreras',
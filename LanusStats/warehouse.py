@@ -0,0 +1,256 @@
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+import pandas as pd
+from .output import _unique_columns
+
+DEFAULT_WAREHOUSE_PATH = os.path.join(os.path.expanduser('~'), '.local', 'share', 'lanusstats', 'warehouse.sqlite')
+
+# table -> key columns (and their SQLite type). The keys are ids of the source, so storing
+# the same match or season table again updates its rows instead of duplicating them.
+TABLES = {
+    'sofascore_player_match_stats': {'match_id': 'INTEGER', 'player_id': 'INTEGER'},
+    'sofascore_shotmap': {'match_id': 'INTEGER', 'shot_id': 'INTEGER'},
+    'fotmob_shotmap': {'match_id': 'INTEGER', 'shot_id': 'INTEGER'},
+    'fotmob_player_season_stats': {'league': 'TEXT', 'season': 'TEXT', 'stat': 'TEXT', 'participant_id': 'INTEGER'},
+    'fotmob_team_season_stats': {'league': 'TEXT', 'season': 'TEXT', 'stat': 'TEXT', 'participant_id': 'INTEGER'},
+    'fbref_player_season_stats': {'league': 'TEXT', 'season': 'TEXT', 'stat': 'TEXT', 'player': 'TEXT', 'squad': 'TEXT', 'born': 'TEXT'},
+    'fbref_team_season_stats': {'league': 'TEXT', 'season': 'TEXT', 'stat': 'TEXT', 'squad': 'TEXT'},
+    'datafactory_incidences': {'league': 'TEXT', 'match_id': 'INTEGER', 'incidence_type': 'TEXT', 'incidence_id': 'TEXT'},
+    'transfermarkt_valuations': {'league': 'TEXT', 'season': 'TEXT', 'club': 'TEXT'},
+}
+UPDATED_AT_COLUMN = 'updated_at'
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_type(column):
+    if pd.api.types.is_bool_dtype(column) or pd.api.types.is_integer_dtype(column):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(column):
+        return 'REAL'
+    return 'TEXT'
+
+
+def _sql_value(value):
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float, str, bytes)):
+        return value
+    return str(value)
+
+
+def _first_column(df, names):
+    """First column whose name (case insensitive) is one of names or ends with _<name>."""
+    for column in df.columns:
+        lower = str(column).lower()
+        if lower in names or any(lower.endswith(f'_{name}') for name in names):
+            return column
+    raise ValueError(f"None of the columns {list(names)} is in the table")
+
+
+class Warehouse:
+    """Local SQLite store for the data of every scraper, to query whole seasons without
+    scraping them again.
+
+    Each table (see TABLES) is keyed by the ids of its source and stores are upserts: storing a
+    match, or a season table, again replaces its rows. The stat columns are created the first
+    time they are seen, the key columns never change.
+
+    Usage:
+        warehouse = Warehouse()
+        sofascore = SofaScore()
+        warehouse.store_sofascore_shotmap(sofascore.get_match_shotmap(match_url))
+        warehouse.table('sofascore_shotmap', match_id=11352380)
+        warehouse.query('SELECT "teamName", SUM("xg") AS xg FROM sofascore_shotmap GROUP BY 1')
+
+    Args:
+        path (str, optional): SQLite file. Defaults to ~/.local/share/lanusstats/warehouse.sqlite.
+    """
+
+    def __init__(self, path=DEFAULT_WAREHOUSE_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self._columns = {}
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # Readers (e.g. another notebook) are not blocked while a scraper writes
+        self._db.execute('PRAGMA journal_mode=WAL')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def upsert(self, table, df, **keys):
+        """Insert the rows of df in table, updating the rows with the same keys.
+
+        Args:
+            table (str): Table inside TABLES.
+            df (DataFrame): Rows to store. It must have the key columns of the table, or
+                they are passed as keyword arguments with a value for every row.
+            **keys: Values of key columns that are the same for every row (e.g. league='Serie A').
+
+        Raises:
+            ValueError: If the table is unknown or a key column is missing or empty.
+
+        Returns:
+            int: Number of rows stored.
+        """
+        if table not in TABLES:
+            raise ValueError(f"Unknown table '{table}'. Possible tables are {list(TABLES)}")
+        key_types = TABLES[table]
+        df = df.set_axis(_unique_columns(df.columns), axis=1)
+        for key, value in keys.items():
+            df[key] = '' if value is None and key_types.get(key) == 'TEXT' else value
+        missing = [key for key in key_types if key not in df.columns]
+        if missing:
+            raise ValueError(f"Missing key columns {missing} for table '{table}'")
+        if df[list(key_types)].isna().any().any():
+            raise ValueError(f"Rows without a value in the key columns {list(key_types)} of table '{table}'")
+
+        # SQLite column names are case insensitive: a stat column named like a key is the key itself
+        key_names = {key.lower() for key in key_types}
+        data_columns = [column for column in df.columns if column not in key_types and column.lower() not in key_names]
+        names = _unique_columns([column.lower() for column in data_columns])
+        df = df.rename(columns={column: column + name[len(column):] for column, name in zip(data_columns, names) if name != column.lower()})
+        data_columns = [column + name[len(column):] for column, name in zip(data_columns, names)]
+        columns = list(key_types) + data_columns
+        updated_at = time.time()
+        rows = [
+            [_sql_value(value) for value in row] + [updated_at]
+            for row in df[columns].astype(object).itertuples(index=False, name=None)
+        ]
+
+        insert_columns = columns + [UPDATED_AT_COLUMN]
+        assignments = ', '.join(f'{_quote(column)} = excluded.{_quote(column)}' for column in data_columns + [UPDATED_AT_COLUMN])
+        sql = (
+            f'INSERT INTO {_quote(table)} ({", ".join(map(_quote, insert_columns))}) '
+            f'VALUES ({", ".join("?" * len(insert_columns))}) '
+            f'ON CONFLICT ({", ".join(map(_quote, key_types))}) DO UPDATE SET {assignments}'
+        )
+        with self._lock:
+            self._ensure_table(table, df, data_columns)
+            with self._db:
+                self._db.executemany(sql, rows)
+        return len(rows)
+
+    def query(self, sql, params=None):
+        """Run a SQL query and return its result as a DataFrame."""
+        with self._lock:
+            return pd.read_sql_query(sql, self._db, params=params)
+
+    def table(self, table, **filters):
+        """Rows of a table, optionally only the ones with certain values (e.g. season='2023').
+
+        Returns:
+            DataFrame: Rows of the table, empty if it was never stored.
+        """
+        if table not in self.tables():
+            return pd.DataFrame(columns=list(TABLES.get(table, {})))
+        where = ' AND '.join(f'{_quote(column)} = ?' for column in filters)
+        sql = f'SELECT * FROM {_quote(table)}' + (f' WHERE {where}' if where else '')
+        return self.query(sql, [_sql_value(value) for value in filters.values()])
+
+    def tables(self):
+        """Tables that already have data."""
+        with self._lock:
+            rows = self._db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        return [name for (name,) in rows if name in TABLES]
+
+    def delete(self, table, **filters):
+        """Delete the rows of a table with certain values (e.g. match_id=11352380)."""
+        if table not in self.tables():
+            return 0
+        where = ' AND '.join(f'{_quote(column)} = ?' for column in filters) or '1'
+        with self._lock, self._db:
+            cursor = self._db.execute(f'DELETE FROM {_quote(table)} WHERE {where}', [_sql_value(value) for value in filters.values()])
+        return cursor.rowcount
+
+    def _ensure_table(self, table, df, data_columns):
+        if table not in self._columns:
+            key_types = TABLES[table]
+            keys = ', '.join(f'{_quote(key)} {sql_type} NOT NULL' for key, sql_type in key_types.items())
+            self._db.execute(
+                f'CREATE TABLE IF NOT EXISTS {_quote(table)} ({keys}, {_quote(UPDATED_AT_COLUMN)} REAL, '
+                f'PRIMARY KEY ({", ".join(map(_quote, key_types))}))'
+            )
+            existing = self._db.execute(f'PRAGMA table_info({_quote(table)})').fetchall()
+            self._columns[table] = {row[1].lower() for row in existing}
+        known = self._columns[table]
+        for column in data_columns:
+            if column.lower() not in known:
+                self._db.execute(f'ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)} {_sql_type(df[column])}')
+                known.add(column.lower())
+
+    # Stores for the DataFrames as the scrapers return them
+
+    def store_sofascore_players_match_stats(self, match_id, home, away):
+        """Store SofaScore.get_players_match_stats(match_url) (both teams) of a match."""
+        df = pd.concat([home, away], ignore_index=True)
+        df = df.set_axis(_unique_columns(df.columns), axis=1)
+        return self.upsert('sofascore_player_match_stats', df.assign(player_id=df['id']), match_id=match_id)
+
+    def store_sofascore_shotmap(self, df):
+        """Store SofaScore.get_match_shotmap(match_url)."""
+        df = df.set_axis(_unique_columns(df.columns), axis=1)
+        # The first id is the one of the shot, the player id comes after it
+        return self.upsert('sofascore_shotmap', df.assign(shot_id=df['id']))
+
+    def store_fotmob_shotmap(self, df):
+        """Store FotMob.get_match_shotmap(match_id)."""
+        return self.upsert('fotmob_shotmap', df.assign(shot_id=df['id']))
+
+    def store_fotmob_season_stats(self, df, league, season, stat, kind='players'):
+        """Store FotMob.get_players_stats_season (kind='players') or get_teams_stats_season (kind='teams')."""
+        table = 'fotmob_player_season_stats' if kind == 'players' else 'fotmob_team_season_stats'
+        participant = _first_column(df, ('participantid', 'particiantid', 'id'))
+        return self.upsert(table, df.assign(participant_id=df[participant]), league=league, season=season, stat=stat)
+
+    def store_fbref_player_stats(self, df, league, season, stat):
+        """Store Fbref.get_player_season_stats (or stat='all' for get_all_player_season_stats)."""
+        df = df.set_axis(_unique_columns(df.columns), axis=1)
+        keys = {key: df[_first_column(df, (key,))].astype(str) for key in ('player', 'squad', 'born')}
+        return self.upsert('fbref_player_season_stats', df.assign(**keys), league=league, season=season, stat=stat)
+
+    def store_fbref_team_stats(self, df, league, season, stat):
+        """Store Fbref.get_teams_season_stats (or stat='all' for get_all_teams_season_stats)."""
+        df = df.set_axis(_unique_columns(df.columns), axis=1)
+        return self.upsert('fbref_team_season_stats', df.assign(squad=df.iloc[:, 0].astype(str)), league=league, season=season, stat=stat)
+
+    def store_datafactory_incidences(self, df, league, match_id, incidence_type):
+        """Store DataFactory.get_incidence (or get_match_passes with incidence_type='passes')."""
+        df = df.assign(incidence_id=df.index.astype(str))
+        return self.upsert('datafactory_incidences', df, league=league, match_id=match_id, incidence_type=incidence_type)
+
+    def store_datafactory_events(self, df, league, match_id):
+        """Store DataFactory.get_match_events(league, match_id) (long format, every incidence type)."""
+        return self.upsert('datafactory_incidences', df.assign(incidence_id=df['incidence_id'].astype(str)), league=league, match_id=match_id)
+
+    def store_transfermarkt_valuations(self, df, league, season):
+        """Store Transfermarkt.get_league_teams_valuations(league, season)."""
+        return self.upsert('transfermarkt_valuations', df.assign(club=df['Club']), league=league, season=season)
@@ -0,0 +1,88 @@
+"""Compare the table parser backends (bs4 vs lxml) on saved pages.
+
+Without pages it runs on synthetic ones with the layout and size of the real pages
+(see synthetic_pages.py):
+
+    python benchmarks/parse_tables.py --kind players
+
+To measure real pages save them from the browser (Ctrl+S, "HTML only") and pass their paths:
+
+    python benchmarks/parse_tables.py --kind players --league "Primera Division Argentina" stats.html shooting.html
+    python benchmarks/parse_tables.py --kind teams --stat shooting squads-shooting.html
+    python benchmarks/parse_tables.py --kind coach coach-history.html
+
+Kinds:
+    players: Fbref player stats page (Fbref.get_player_season_stats).
+    teams: Fbref squad stats page (Fbref.get_teams_season_stats).
+    coach: Transfermarkt head coach history page (Transfermarkt.get_head_coach_historical_data).
+
+Each page is parsed --repeat times with each backend. The script checks that both give
+the same DataFrame and prints the best time of each and the speedup.
+"""
+import argparse
+import pathlib
+import time
+
+from LanusStats.fbref import Fbref
+from LanusStats.transfermarkt import Transfermarkt
+
+import synthetic_pages
+
+
+def make_parse(kind, parser, stat):
+    if kind == 'players':
+        fbref = Fbref(parser=parser)
+        return lambda content, league: fbref._player_stats_from_html(content, stat, league, True)
+    if kind == 'teams':
+        fbref = Fbref(parser=parser)
+        return lambda content, league: fbref._teams_stats_from_html(content, stat)
+
+    def parse_coach(content, league):
+        transfermarkt = Transfermarkt(parser=parser)
+        transfermarkt.transfermarkt_request = lambda url: content
+        return transfermarkt.get_head_coach_historical_data('', '')
+    return parse_coach
+
+
+def read_pages(args):
+    """(name, content, league) of the pages given, or of the synthetic ones if there are none."""
+    if not args.pages:
+        return [(name, content, args.league or league)
+                for name, content, league in synthetic_pages.pages(args.kind, args.stat)]
+    pages = []
+    for page in args.pages:
+        path = pathlib.Path(page)
+        # Fbref HTML comes from the browser as str, Transfermarkt from requests as bytes
+        content = path.read_bytes() if args.kind == 'coach' else path.read_text(encoding='utf-8')
+        pages.append((path.name, content, args.league or synthetic_pages.BIG5))
+    return pages
+
+
+def best_time(parse, content, league, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = parse(content, league)
+        times.append(time.perf_counter() - start)
+    return min(times), df
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('pages', nargs='*', help='Paths of saved HTML pages. Defaults to synthetic pages')
+    arg_parser.add_argument('--kind', choices=['players', 'teams', 'coach'], default='players')
+    arg_parser.add_argument('--stat', default='stats', help="Stat of the Fbref page. Defaults to 'stats'")
+    arg_parser.add_argument('--league', help="League of the Fbref players pages. Defaults to 'Big 5 European Leagues' (or the league of each synthetic page)")
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    parsers = {name: make_parse(args.kind, name, args.stat) for name in ['bs4', 'lxml']}
+    print(f"{'page':40} {'rows':>6} {'bs4 (s)':>9} {'lxml (s)':>9} {'speedup':>8}  same")
+    for name, content, league in read_pages(args):
+        bs4_time, bs4_df = best_time(parsers['bs4'], content, league, args.repeat)
+        lxml_time, lxml_df = best_time(parsers['lxml'], content, league, args.repeat)
+        print(f'{name[:40]:40} {len(bs4_df):>6} {bs4_time:>9.3f} {lxml_time:>9.3f} {bs4_time / lxml_time:>7.1f}x  {bs4_df.equals(lxml_df)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Synthetic pages with the same layout as the real ones, for the parsing benchmarks.
+
+They follow the markup the parsers read (FBref tables inside HTML comments, over_header
+rows, the squad row header, the Transfermarkt items table) filled with random values, so
+the benchmarks run without saving pages from the browser. The size is close to the real
+pages: a players page of a league has ~600 rows and a Big 5 one ~2800.
+
+    python benchmarks/synthetic_pages.py --out pages/   # write them to look at them
+"""
+import argparse
+import pathlib
+import random
+
+PLAYER_COLUMNS = [
+    ('Player', 'player'), ('Nation', 'nationality'), ('Pos', 'position'), ('Squad', 'team'),
+    ('Age', 'age'), ('Born', 'birth_year'), ('MP', 'games'), ('Starts', 'games_starts'),
+    ('Min', 'minutes'), ('90s', 'minutes_90s'), ('Gls', 'goals'), ('Ast', 'assists'),
+    ('G+A', 'goals_assists'), ('G-PK', 'goals_pens'), ('PK', 'pens_made'), ('PKatt', 'pens_att'),
+    ('CrdY', 'cards_yellow'), ('CrdR', 'cards_red'), ('xG', 'xg'), ('npxG', 'npxg'),
+    ('xAG', 'xg_assist'), ('npxG+xAG', 'npxg_xg_assist'), ('PrgC', 'progressive_carries'),
+    ('PrgP', 'progressive_passes'), ('PrgR', 'progressive_passes_received'),
+    ('Gls', 'goals_per90'), ('Ast', 'assists_per90'), ('G+A', 'goals_assists_per90'),
+    ('G-PK', 'goals_pens_per90'), ('xG', 'xg_per90'), ('xAG', 'xg_assist_per90'),
+    ('Matches', 'matches'),
+]
+SQUAD_COLUMNS = ['# Pl', '90s', 'Gls', 'Sh', 'SoT', 'SoT%', 'Sh/90', 'SoT/90', 'G/Sh', 'G/SoT',
+                 'Dist', 'FK', 'PK', 'PKatt', 'xG', 'npxG', 'npxG/Sh', 'G-xG', 'np:G-xG']
+POSITIONS = ['GK', 'DF', 'MF', 'FW', 'DF,MF', 'MF,FW']
+NATIONS = ['ar ARG', 'uy URU', 'br BRA', 'co COL', 'py PAR', 'es ESP', 'fr FRA']
+
+
+def _team(index):
+    return f'Team {index:02d}'
+
+
+def _player_cell(stat, rng, index):
+    if stat == 'player':
+        return f'<a href="/en/players/{index:08x}/">Player {index}</a>'
+    if stat == 'nationality':
+        flag, code = rng.choice(NATIONS).split()
+        return f'<a href="/en/country/{code}/"><span class="f-i f-{flag}"></span> {code}</a>'
+    if stat == 'position':
+        return rng.choice(POSITIONS)
+    if stat == 'team':
+        return f'<a href="/en/squads/{index % 28:08x}/">{_team(index % 28)}</a>'
+    if stat == 'age':
+        return f'{rng.randint(17, 38)}-{rng.randint(0, 364):03d}'
+    if stat == 'birth_year':
+        return str(rng.randint(1986, 2008))
+    if stat == 'matches':
+        return f'<a href="/en/players/{index:08x}/matchlogs/">Matches</a>'
+    if stat.endswith('per90') or stat.startswith(('xg', 'npxg')) or stat == 'minutes_90s':
+        return f'{rng.random() * 10:.2f}'
+    if stat == 'minutes':
+        return f'{rng.randint(0, 3000):,}'
+    return str(rng.randint(0, 30))
+
+
+def player_stats_page(rows=600, seed=0, big5=False):
+    """FBref players stats page (Fbref.get_player_season_stats): in a league page the table is
+    commented out inside a table_container, in the Big 5 one it is live. It has an over_header
+    row and a rank <th>."""
+    rng = random.Random(seed)
+    head = ''.join(f'<th aria-label="{name}" data-stat="{stat}" scope="col">{name}</th>' for name, stat in PLAYER_COLUMNS)
+    body = []
+    for index in range(rows):
+        cells = ''.join(f'<td data-stat="{stat}">{_player_cell(stat, rng, index)}</td>' for _, stat in PLAYER_COLUMNS)
+        body.append(f'<tr><th scope="row" class="right" data-stat="ranker">{index + 1}</th>{cells}</tr>')
+    table = (
+        '<table class="stats_table sortable min_width" id="stats_standard">'
+        '<thead><tr class="over_header"><th colspan="7"></th><th colspan="4" data-stat="header_playing">Playing Time</th>'
+        '<th colspan="8" data-stat="header_performance">Performance</th></tr>'
+        f'<tr><th scope="col" data-stat="ranker">Rk</th>{head}</tr></thead>'
+        f'<tbody>{"".join(body)}</tbody></table>'
+    )
+    container = f'<div class="table_container" id="div_stats_standard">{table}</div>'
+    return (
+        '<html><head><meta charset="utf-8"><title>Player Stats | FBref.com</title></head><body>'
+        '<div id="content"><div class="table_wrapper" id="all_stats_standard">'
+        f'{container if big5 else f"<!--{chr(10)}{container}{chr(10)}-->"}'
+        '</div></div></body></html>'
+    )
+
+
+def squad_stats_page(stat='shooting', teams=28, seed=0):
+    """FBref squad stats page (Fbref.get_teams_season_stats) with the live 'for' table and
+    the commented out 'against' one."""
+    rng = random.Random(seed)
+    normalized_stat = stat.rstrip('s') or stat
+    head = '<th scope="col" data-stat="team">Squad</th>' + ''.join(f'<th scope="col">{name}</th>' for name in SQUAD_COLUMNS)
+
+    def table(suffix, prefix=''):
+        rows = []
+        for index in range(teams):
+            values = ''.join(f'<td>{rng.random() * 100:.1f}</td>' for _ in SQUAD_COLUMNS)
+            rows.append(f'<tr><th scope="row" data-stat="squad"><a href="/en/squads/{index:08x}/">{prefix}{_team(index)}</a></th>{values}</tr>')
+        return (
+            f'<table class="stats_table" id="stats_squads_{normalized_stat}_{suffix}">'
+            '<thead><tr class="over_header"><th></th><th colspan="8">Standard</th><th colspan="11">Expected</th></tr>'
+            f'<tr>{head}</tr></thead><tbody>{"".join(rows)}</tbody></table>'
+        )
+
+    return (
+        '<html><head><meta charset="utf-8"></head><body>'
+        f'<div class="table_container">{table("for")}</div>'
+        f'<!--\n<div class="table_container">{table("against", "vs ")}</div>\n-->'
+        '</body></html>'
+    )
+
+
+def head_coach_page(rows=40, seed=0):
+    """Transfermarkt head coach history page (Transfermarkt.get_head_coach_historical_data)."""
+    rng = random.Random(seed)
+    headers = ['wappen', 'Club', 'Appointed', 'In charge until', 'Days in charge', 'Matches', 'PPM']
+    body = []
+    for index in range(rows):
+        start = rng.randint(1995, 2023)
+        body.append(
+            '<tr>'
+            f'<td><img src="https://tmssl.akamaized.net/images/wappen/tiny/{index}.png" alt="Club {index}"></td>'
+            f'<td><a href="/club/{index}">Club</a> <span> {index} </span></td>'
+            f'<td>{start}-07-01</td><td>{start + 1}-06-30</td><td>{rng.randint(30, 900)} days</td>'
+            f'<td>{rng.randint(5, 120)}</td><td>{rng.random() * 3:.2f}</td>'
+            '</tr>'
+        )
+    head = ''.join(f'<th>{header}</th>' for header in headers)
+    return (
+        '<html><head><meta charset="utf-8"></head><body>'
+        f'<table class="items"><thead><tr>{head}</tr></thead><tbody>{"".join(body)}</tbody></table>'
+        '</body></html>'
+    ).encode('utf-8')
+
+
+LEAGUE = 'Primera Division Argentina'
+BIG5 = 'Big 5 European Leagues'
+
+
+def pages(kind, stat='stats'):
+    """(name, content, league) of the default pages of a kind of the parse_tables benchmark.
+    The squad stats page is built for stat, as its table id depends on it."""
+    if kind == 'players':
+        return [
+            ('players-league.html', player_stats_page(600), LEAGUE),
+            ('players-big5.html', player_stats_page(2800, seed=1, big5=True), BIG5),
+        ]
+    if kind == 'teams':
+        return [(f'squads-{stat}.html', squad_stats_page(stat), None)]
+    return [('coach-history.html', head_coach_page(), None)]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--out', default='.', help='Folder where the pages are written')
+    arg_parser.add_argument('--stat', default='shooting', help="Stat of the squad stats page. Defaults to 'shooting'")
+    args = arg_parser.parse_args()
+    out = pathlib.Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    for kind in ['players', 'teams', 'coach']:
+        for name, content, _ in pages(kind, args.stat):
+            path = out / name
+            if isinstance(content, bytes):
+                path.write_bytes(content)
+            else:
+                path.write_text(content, encoding='utf-8')
+            print(path)
+
+
+if __name__ == '__main__':
+    main()
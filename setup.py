@@ -19,6 +19,11 @@ INSTALL_REQUIRES = [
       'pandas', 'mplsoccer', 'requests', 'matplotlib', 'numpy', 'bs4', 'Pillow', 'faker', 'nodriver', 'pydoll-python', 'setuptools'
       ]
 
+EXTRAS_REQUIRE = {
+      'fast': ['lxml'],
+      'parquet': ['pyarrow'],
+      }
+
 setup(
     name=PACKAGE_NAME,
     version=VERSION,
@@ -29,10 +34,11 @@ setup(
     author_email=AUTHOR_EMAIL,
     url=URL,
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     license=LICENSE,
     packages=find_packages(),
     include_package_data=True,
-    package_data={'LanusStats': ['fonts/*.ttf']}
+    package_data={'LanusStats': ['fonts/*.ttf', 'data/*.json']}
 )
 
 